@@ -0,0 +1,102 @@
+"""
+Configuration Format Benchmark for HyprPwMenu
+
+Measures parser import time and parse + validation time of the configuration
+file for each supported format (TOML, JSON, YAML), using the default three
+button configuration and a generated 300 button configuration.
+
+Usage:
+    uv run python benchmarks/bench_config.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import timeit
+from typing import Dict, List
+
+import toml
+import yaml
+
+from hyprpwmenu.config import AppConfig, ConfigFileLoader, ConfigFileSource
+from pathlib import Path
+
+#: Parser module imported for each configuration format
+PARSER_MODULES = {"toml": "tomllib", "json": "json", "yaml": "yaml"}
+
+#: Number of timed repetitions per measurement
+REPEAT = 200
+
+
+def makeButtons(count: int) -> List[Dict[str, str]]:
+    """Build `count` button definitions shaped like the default configuration."""
+    return [
+        {
+            "icon_path": f"~/.config/hyprpwmenu/icon{i}.png",
+            "id": f"button{i}",
+            "hint": f"Action {i}",
+            "command": f"echo action {i}",
+        }
+        for i in range(count)
+    ]
+
+
+def writeConfig(folder: str, fileFormat: str, data: dict) -> Path:
+    """Write `data` as config.<fileFormat> in `folder` and return its path."""
+    path = Path(folder) / f"config.{fileFormat}"
+    if fileFormat == "toml":
+        path.write_text(toml.dumps(data))
+    elif fileFormat == "json":
+        path.write_text(json.dumps(data))
+    else:
+        path.write_text(yaml.safe_dump(data))
+    return path
+
+
+def importTime(module: str) -> float:
+    """Import time of `module` in milliseconds, measured in a fresh interpreter."""
+    code = (
+        "import time; t = time.perf_counter(); "
+        f"import {module}; print(time.perf_counter() - t)"
+    )
+    samples = [
+        float(subprocess.check_output([sys.executable, "-c", code], text=True))
+        for _ in range(10)
+    ]
+    return min(samples) * 1000
+
+
+def parseTime(path: Path) -> float:
+    """Mean parse time of `path` in milliseconds."""
+    return timeit.timeit(lambda: ConfigFileLoader.loadFile(path), number=REPEAT) / REPEAT * 1000
+
+
+def loadTime(path: Path) -> float:
+    """Mean parse + validation time of `path` into AppConfig in milliseconds."""
+    source = ConfigFileSource(file=path)
+    return (
+        timeit.timeit(lambda: AppConfig(config_sources=source), number=REPEAT)
+        / REPEAT
+        * 1000
+    )
+
+
+def main() -> None:
+    print(f"{'buttons':>8} {'format':>6} {'import ms':>10} {'parse ms':>10} {'load ms':>10}")
+    imports = {fmt: importTime(module) for fmt, module in PARSER_MODULES.items()}
+    for count in (3, 300):
+        data = {"buttons": makeButtons(count)}
+        with tempfile.TemporaryDirectory() as folder:
+            for fmt in PARSER_MODULES:
+                path = writeConfig(folder, fmt, data)
+                print(
+                    f"{count:>8} {fmt:>6} {imports[fmt]:>10.3f} "
+                    f"{parseTime(path):>10.3f} {loadTime(path):>10.3f}"
+                )
+                os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Sub-menu Page Switch Benchmark for HyprPwMenu
+
+Builds a synthetic menu of nested sub-menus and reports the time to switch
+pages with the Window methods used by the keyboard and mouse handlers:
+
+    first visit, cold: page built and its icons decoded on the main thread
+    first visit, preloaded: page built after preloadTextures decoded the icons
+    repeat: page already in the stack, only the visible child changes
+
+Every icon path is a distinct copy of a packaged icon, so the texture cache
+does not hide the decoding cost. Times cover the work done in the handler,
+the layout and paint of the following frame are not included. The frame
+budget at 60 Hz is 16.7 ms.
+
+GTK needs a display, so run it inside a Wayland or X11 session with an
+existing ~/.config/hyprpwmenu.
+
+Usage:
+    uv run python benchmarks/bench_pages.py [levels] [entries]
+"""
+
+import os
+import statistics
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+from hyprpwmenu.config import Button
+from hyprpwmenu.window import Window, readAssetFile
+
+#: Number of timed round trips from the top level to the deepest level
+ROUNDS = 20
+
+
+def makeTree(iconDir: str, levels: int, entries: int) -> List[Button]:
+    """Top level buttons of a menu whose first button opens the next level."""
+    icon = readAssetFile("shutdown.png")
+    children: List[Button] = []
+    for level in reversed(range(levels)):
+        buttons = []
+        for i in range(entries):
+            iconPath = os.path.join(iconDir, f"icon-{level}-{i}.png")
+            with open(iconPath, "wb") as f:
+                f.write(icon)
+            if i == 0 and children:
+                buttons.append(
+                    Button(
+                        icon_path=iconPath,
+                        id=f"group{level}",
+                        hint="More",
+                        children=children,
+                    )
+                )
+            else:
+                buttons.append(
+                    Button(
+                        icon_path=iconPath,
+                        id=f"button{level}-{i}",
+                        hint="Bench",
+                        command="true",
+                    )
+                )
+        children = buttons
+    return children
+
+
+def descend(window: Window, samples: List[float]) -> None:
+    """Enter the sub-menu of the first button down to the deepest level."""
+    while window.entries[0].children:
+        start = time.perf_counter()
+        window.enterGroup(window.entries[0])
+        samples.append((time.perf_counter() - start) * 1000)
+
+
+def firstVisits(window: Window, preload: bool) -> List[float]:
+    """Switch times of the first visit of each level on a fresh window."""
+    window.menuPath.clear()
+    window.focusStack.clear()
+    window.entries = window.rootEntries
+    window.currentFocusIndex = 0
+    window.textures.clear()
+    if preload:
+        # Synchronous stand-in for the idle callbacks of preloadTextures
+        stack = list(window.rootEntries)
+        while stack:
+            entry = stack.pop()
+            window.loadTexture(entry.icon_path)
+            stack.extend(entry.children)
+    window.activateSurface(window.buildWindow(window.app, None))
+    window.window.present()
+    samples: List[float] = []
+    descend(window, samples)
+    return samples
+
+
+def repeatVisits(window: Window) -> List[float]:
+    """Switch times going up and down levels whose pages already exist."""
+    samples: List[float] = []
+    for _ in range(ROUNDS):
+        while True:
+            start = time.perf_counter()
+            if not window.leaveGroup():
+                break
+            samples.append((time.perf_counter() - start) * 1000)
+        descend(window, samples)
+    return samples
+
+
+def main() -> None:
+    levels = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    entries = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    with tempfile.TemporaryDirectory() as iconDir:
+        window = Window(unique=False)
+        window.rootEntries = makeTree(iconDir, levels, entries)
+        results: Dict[str, List[float]] = {}
+
+        def onActivate(app) -> None:
+            results["first visit, cold"] = firstVisits(window, preload=False)
+            window.window.destroy()
+            results["first visit, preloaded"] = firstVisits(window, preload=True)
+            results["repeat"] = repeatVisits(window)
+            app.quit()
+
+        # Measure synthetic pages instead of opening the configured menu
+        window.app.disconnect_by_func(window.on_activate)
+        window.app.connect("activate", onActivate)
+        window.app.run(None)
+
+    print(f"{levels} levels of {entries} entries")
+    print(f"{'switch':>24} {'median ms':>10} {'max ms':>10}")
+    for name, values in results.items():
+        print(f"{name:>24} {statistics.median(values):>10.2f} {max(values):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
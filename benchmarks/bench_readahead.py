@@ -0,0 +1,92 @@
+"""
+Cold Start Readahead Benchmark for HyprPwMenu
+
+Measures cold time-to-first-frame with and without the startup readahead.
+Before every run the page cache is dropped, so this must run as root inside
+a disposable VM or container with a Wayland session (e.g. a nested Hyprland)
+and an existing ~/.config/hyprpwmenu. The readahead list must have been
+recorded by a normal launch of hyprpwmenu beforehand.
+
+Time-to-first-frame is the wall time from spawning the process until it
+reports its first painted frame, interpreter startup and imports included.
+
+Usage:
+    sudo uv run python benchmarks/bench_readahead.py [runs]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+from hyprpwmenu.constants import READAHEAD_BOOT_FILE
+from hyprpwmenu.readahead import loadReadaheadList
+
+#: Child program, opens the menu and quits after the first frame
+CHILD = """
+import sys
+if sys.argv[1] == "1":
+    from hyprpwmenu.readahead import startReadahead
+    startReadahead()
+from hyprpwmenu.renderer import probeChild
+probeChild(frames=1)
+"""
+
+
+def dropCaches() -> None:
+    """
+    Flush dirty pages, drop the page cache, dentries and inodes, and forget
+    the boot id of the last prefetch, as after a reboot.
+    """
+    subprocess.run(["sync"], check=True)
+    with open("/proc/sys/vm/drop_caches", "w") as f:
+        f.write("3\n")
+    try:
+        os.remove(READAHEAD_BOOT_FILE)
+    except FileNotFoundError:
+        pass
+
+
+def coldFirstFrame(readahead: bool) -> float:
+    """Cold time-to-first-frame of one launch in milliseconds."""
+    dropCaches()
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-c", CHILD, "1" if readahead else "0"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    for line in process.stdout:
+        if line.startswith("{"):
+            elapsed = time.perf_counter() - start
+            break
+    else:
+        raise RuntimeError("The menu exited before painting a frame")
+    process.wait()
+    return elapsed * 1000
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    if loadReadaheadList() is None:
+        sys.exit("No readahead list recorded, launch hyprpwmenu once first.")
+
+    samples: Dict[str, List[float]] = {"without": [], "with": []}
+    for _ in range(runs):
+        # Interleave both variants so drift affects them equally
+        samples["without"].append(coldFirstFrame(readahead=False))
+        samples["with"].append(coldFirstFrame(readahead=True))
+
+    print(f"{'readahead':>10} {'median ms':>10} {'min ms':>10} {'max ms':>10}")
+    for name, values in samples.items():
+        print(
+            f"{name:>10} {statistics.median(values):>10.1f} "
+            f"{min(values):>10.1f} {max(values):>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Widget Construction Benchmark for HyprPwMenu
+
+Compares the time to build one power menu button with the former imperative
+path (widgets, setters, controllers and lambdas created call by call) and with
+the MenuButton Gtk.Template used by the window module.
+
+GTK needs a display, so run it inside a Wayland or X11 session.
+
+Usage:
+    uv run python benchmarks/bench_widgets.py [buttons]
+"""
+
+import sys
+import time
+from typing import Callable
+
+from hyprpwmenu.window import Gdk, GLib, Gtk, MenuButton, readAssetFile
+
+#: Number of timed rounds, the best one is reported
+ROUNDS = 5
+
+
+def onEnter(controller, x, y, button) -> None:
+    pass
+
+
+def onLeave(controller, button) -> None:
+    pass
+
+
+def onClicked(button) -> None:
+    pass
+
+
+def imperativeButton(texture: Gdk.Texture) -> Gtk.Button:
+    """The button construction of window.makeButton before the templates."""
+    image = Gtk.Image.new_from_paintable(texture)
+    button = Gtk.Button.new()
+    button.set_child(image)
+    button.set_name("buttonBench")
+
+    motionController = Gtk.EventControllerMotion()
+    motionController.connect(
+        "enter", lambda controller, x, y: onEnter(controller, x, y, button)
+    )
+    motionController.connect("leave", lambda controller: onLeave(controller, button))
+    button.add_controller(motionController)
+
+    button.connect("clicked", onClicked)
+    button.set_tooltip_text("Bench")
+    return button
+
+
+def templateButton(texture: Gdk.Texture) -> Gtk.Button:
+    """The button construction of window.makeButton with the MenuButton template."""
+    button = MenuButton()
+    button.image.set_from_paintable(texture)
+    button.set_name("buttonBench")
+    button.motion_controller.connect("enter", onEnter, button)
+    button.motion_controller.connect("leave", onLeave, button)
+    button.connect("clicked", onClicked)
+    button.set_tooltip_text("Bench")
+    return button
+
+
+def perButton(
+    build: Callable[[Gdk.Texture], Gtk.Button], texture: Gdk.Texture, count: int
+) -> float:
+    """Best time per button over ROUNDS rounds of `count` buttons, in microseconds."""
+    best = float("inf")
+    for _ in range(ROUNDS):
+        row = Gtk.Box()
+        start = time.perf_counter()
+        for _ in range(count):
+            row.append(build(texture))
+        best = min(best, time.perf_counter() - start)
+    return best / count * 1e6
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    texture = Gdk.Texture.new_from_bytes(GLib.Bytes.new(readAssetFile("shutdown.png")))
+
+    # Warm up both paths so type registration is not measured
+    imperativeButton(texture)
+    templateButton(texture)
+
+    print(f"{'path':>10} {'us/button':>10}")
+    paths = (("imperative", imperativeButton), ("template", templateButton))
+    for name, build in paths:
+        print(f"{name:>10} {perButton(build, texture, count):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,8 @@ files and CSS styling.
 
 # filepath: /home/antrax/Dev/hyprpwmenu/src/hyprpwmenu/__init__.py
 
+import sys
+
 
 def main() -> None:
     """
@@ -19,6 +21,12 @@ def main() -> None:
     It serves as the primary entry point when the package is run as a script
     or installed as a console script.
 
+    Files recorded by the readahead module are prefetched first, in a
+    background thread, to speed up launches with a cold page cache.
+
+    With `--profile DIR` the whole path, imports included, runs under the
+    profiler chosen with `--profiler` and the result is written to DIR.
+
     The function initializes the command-line interface which handles:
     - Configuration file validation and creation
     - Style file validation and creation
@@ -32,6 +40,26 @@ def main() -> None:
         ImportError: If the click module or its dependencies cannot be imported
         SystemExit: If configuration loading fails or other critical errors occur
 
+    """
+    from .readahead import startReadahead
+
+    startReadahead()
+
+    if any(arg.startswith("--profile") for arg in sys.argv[1:]):
+        from .profiler import PROFILERS, argvOption, runProfiled
+
+        profileDir = argvOption(sys.argv[1:], "--profile")
+        profiler = argvOption(sys.argv[1:], "--profiler") or PROFILERS[0]
+        if profileDir is not None and profiler in PROFILERS:
+            runProfiled(runCli, profileDir, profiler)
+            return
+
+    runCli()
+
+
+def runCli() -> None:
+    """
+    Import and run the command-line interface.
     """
     from .click import cli
 
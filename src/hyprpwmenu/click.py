@@ -8,6 +8,13 @@ The module defines command-line options for specifying custom configuration and
 and provides automatic creation of default files when they don't exist.
 
 Functions:
+    parseArgs: Build the argument parser and parse the command line
+    convertCommand: Convert the configuration file to TOML or JSON
+    probeCommand: Measure the GSK renderers and store the fastest one
+    assetTable: Build a table showing the outcome of asset provisioning
+    initCommand: Install missing assets and update unmodified outdated ones
+    provisionOnLaunch: Provision the assets during a launch and show the outcome
+    statusTable: Build a table showing whether the active files exist
     cli: Main CLI command function that processes arguments and launches the application
 
 Classes:
@@ -17,65 +24,300 @@ Constants:
     CONTEXT_SETTINGS: Click context configuration for help options
 """
 
+import argparse
+import os
 import sys
+from typing import List, Optional
+from confz.exceptions import FileException
 from rich.table import Table
-from hyprpwmenu.util import cl, fileExists, showError, copyAssetFile
-from hyprpwmenu.window import Window
+from hyprpwmenu.util import cl, fileExists, showError, showStatus
+from hyprpwmenu.config import AppConfig, convertConfigFile, findConfigFile
+from hyprpwmenu.renderer import applyRenderer, probeRenderers
+from hyprpwmenu.profiler import PROFILE_STOPS, PROFILERS, attachProfileStop
+from hyprpwmenu.readahead import clearReadahead, needsRecording, recordStartupFiles
+from hyprpwmenu.provision import AssetStatus, provisionAssets, provisioningCurrent
 from hyprpwmenu.constants import (
     APP_NAME,
     APP_VERSION,
-    DEFAULT_CONFIG_FILE,
+    RENDERER_CACHE_FILE,
+    RENDERERS,
     DEFAULT_STYLE_FILE,
     DEFAULT_CONFIG_DIR,
 )
 
 
-def cli() -> None:
+#: Color of each asset provisioning status in the asset table
+ASSET_STATUS_COLORS = {
+    "installed": "green",
+    "updated": "green",
+    "current": "cyan",
+    "modified": "yellow",
+    "skipped": "magenta",
+}
+
+
+def parseArgs(argv: Optional[List[str]] = None) -> argparse.Namespace:
     """
-    Main CLI command function for HyprPwMenu application.
+    Build the argument parser and parse the command line.
+
+    Args:
+        argv: Arguments to parse, defaults to sys.argv[1:]
+
+    Returns:
+        argparse.Namespace: Parsed arguments, `command` is None for a GUI launch
     """
-    cl.print(
-        f"[bold cyan]{APP_NAME}[/bold cyan] [magenta]v[/magenta][green]{APP_VERSION}[/green]\n"
+    parser = argparse.ArgumentParser(
+        prog=APP_NAME, description="A modern powermenu for Hyprland."
+    )
+    parser.add_argument(
+        "-v", "--version", action="version", version=f"{APP_NAME} {APP_VERSION}"
+    )
+    parser.add_argument(
+        "-r",
+        "--renderer",
+        choices=RENDERERS,
+        default=None,
+        help="GSK renderer, overrides the configuration (auto uses the probed one)",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="DIR",
+        default=None,
+        help="profile the run and write a .collapsed or .pstats file to DIR",
     )
+    parser.add_argument(
+        "--profiler",
+        choices=PROFILERS,
+        default=PROFILERS[0],
+        help="sample: low overhead stack sampler writing collapsed stacks, "
+        "cprofile: deterministic cProfile statistics (default: sample)",
+    )
+    parser.add_argument(
+        "--profile-until",
+        dest="profileUntil",
+        choices=PROFILE_STOPS,
+        default="first-frame",
+        help="stop a profiled run after the first frame or the first action "
+        "(the action's command is not run)",
+    )
+    subparsers = parser.add_subparsers(dest="command")
 
-    cl.print("Configuration Status...")
-    # Criação da tabela
+    convertParser = subparsers.add_parser(
+        "convert", help="convert the configuration file to TOML or JSON"
+    )
+    convertParser.add_argument(
+        "--to",
+        dest="targetFormat",
+        choices=("toml", "json"),
+        default="toml",
+        help="target format (default: toml)",
+    )
+    convertParser.add_argument(
+        "--source",
+        default=None,
+        help="configuration file to convert (default: the active one)",
+    )
+    convertParser.add_argument(
+        "--force",
+        action="store_true",
+        help="overwrite an existing target file",
+    )
+
+    subparsers.add_parser(
+        "probe", help="measure the GSK renderers and store the fastest one"
+    )
+    subparsers.add_parser(
+        "init", help="install missing assets and update unmodified outdated ones"
+    )
+
+    return parser.parse_args(argv)
+
+
+def convertCommand(args: argparse.Namespace) -> None:
+    """
+    Convert the configuration file to TOML or JSON.
+
+    Args:
+        args: Parsed arguments of the `convert` subcommand
+    """
+    source = args.source or findConfigFile()
+    if not fileExists(file=source):
+        showError(f"{source} does not exist.")
+        sys.exit(1)
+
+    try:
+        target = convertConfigFile(
+            source=source, targetFormat=args.targetFormat, force=args.force
+        )
+    except Exception as e:
+        showError(f"Error: {e}")
+        sys.exit(1)
+
+    showStatus("CONVERTED", f"{source} -> {target}")
+    active = findConfigFile(os.path.dirname(target))
+    if active != target:
+        showStatus("NOTE", f"{active} still takes precedence over {target}")
+
+
+def probeCommand() -> None:
+    """
+    Measure the GSK renderers and store the fastest one.
+    """
+    cl.print("Probing GSK renderers...")
+    results = probeRenderers()
+
+    table = Table(show_header=True, header_style="bold cyan")
+    table.add_column("Renderer", justify="right")
+    table.add_column("First frame", justify="right")
+    table.add_column("Frame time", justify="right")
+    for renderer, result in results.items():
+        if result is None:
+            table.add_row(renderer, "[bold red]unavailable[/bold red]", "")
+        else:
+            table.add_row(
+                renderer,
+                f"{result['firstFrame'] * 1000:.1f} ms",
+                f"{result['frameTime'] * 1000:.2f} ms",
+            )
+    cl.print(table)
+
+    if not any(results.values()):
+        showError("No renderer could be probed.")
+        sys.exit(1)
+    showStatus("SAVED", RENDERER_CACHE_FILE)
+
+
+def assetTable(statuses: List[AssetStatus]) -> Table:
+    """
+    Build a table showing the outcome of asset provisioning.
+
+    Args:
+        statuses: Outcome of each asset
+
+    Returns:
+        Table: Rich table with one row per asset
+    """
+    table = Table(show_header=True, header_style="bold cyan")
+    table.add_column("Asset", justify="right")
+    table.add_column("Path")
+    table.add_column("Status", justify="center")
+    for status in statuses:
+        color = ASSET_STATUS_COLORS[status.status]
+        table.add_row(
+            status.asset,
+            f"[yellow]{status.path}[/yellow]",
+            f"[bold {color}]{status.status}[/bold {color}]",
+        )
+    return table
+
+
+def initCommand() -> None:
+    """
+    Install missing assets and update unmodified outdated ones.
+    """
+    cl.print(f"Provisioning {DEFAULT_CONFIG_DIR}...")
+    try:
+        statuses = provisionAssets()
+    except Exception as e:
+        showError(f"Error: {e}")
+        sys.exit(1)
+    cl.print(assetTable(statuses))
+
+    if any(status.status == "modified" for status in statuses):
+        showStatus("NOTE", "Modified files were kept, delete them to get new versions")
+
+
+def provisionOnLaunch() -> None:
+    """
+    Provision the assets during a launch and show the outcome.
+    """
+    showStatus("ASSETS", f"Provisioning {DEFAULT_CONFIG_DIR}...")
+    cl.print(assetTable(provisionAssets()))
+
+
+def statusTable(configFile: str) -> Table:
+    """
+    Build a table showing whether the active configuration and style files exist.
+
+    Args:
+        configFile: Path of the active configuration file
+
+    Returns:
+        Table: Rich table with one row per file
+    """
     table = Table(show_header=True, header_style="bold cyan")
     table.add_column("Item", justify="right")
     table.add_column("Path")
     table.add_column("Status", justify="center")
+    for item, path in (("Config", configFile), ("Style", DEFAULT_STYLE_FILE)):
+        status = (
+            "[bold green]Passed[/bold green]"
+            if fileExists(file=path)
+            else "[bold red]Missing[/bold red]"
+        )
+        table.add_row(item, f"[yellow]{path}[/yellow]", status)
+    return table
 
-    configFileOk = fileExists(file=DEFAULT_CONFIG_FILE)
-    styleFileOk = fileExists(file=DEFAULT_STYLE_FILE)
-    if not configFileOk:
-        showError(f"{DEFAULT_CONFIG_FILE} does not exist. Creating...")
-        copyAssetFile(destination=DEFAULT_CONFIG_DIR, asset="config.yaml")
-        copyAssetFile(destination=DEFAULT_CONFIG_DIR, asset="logoff.png")
-        copyAssetFile(destination=DEFAULT_CONFIG_DIR, asset="reboot.png")
-        copyAssetFile(destination=DEFAULT_CONFIG_DIR, asset="shutdown.png")
-        configFileOk = True  # Update status after creation
-
-    if not styleFileOk:
-        showError(f"{DEFAULT_STYLE_FILE} does not exist. Creating...")
-        copyAssetFile(destination=DEFAULT_CONFIG_DIR, asset="style.css")
-        styleFileOk = True  # Update status after creation
-
-    table.add_row(
-        "Config",
-        f"[yellow]{DEFAULT_CONFIG_FILE}[/yellow]",
-        f"{'[bold green]Passed[/bold green]' if configFileOk else '[bold red]Fail[/bold red]'}",
-    )
-    table.add_row(
-        "Style",
-        f"[yellow]{DEFAULT_STYLE_FILE}[/yellow]",
-        f"{'[bold green]Passed[/bold green]' if styleFileOk else '[bold red]Fail[/bold red]'}",
+
+def cli() -> None:
+    """
+    Main CLI command function for HyprPwMenu application.
+    """
+    args = parseArgs()
+
+    cl.print(
+        f"[bold cyan]{APP_NAME}[/bold cyan] [magenta]v[/magenta][green]{APP_VERSION}[/green]\n"
     )
 
-    cl.print(table)
+    if args.command == "convert":
+        convertCommand(args)
+        return
+    if args.command == "probe":
+        probeCommand()
+        return
+    if args.command == "init":
+        initCommand()
+        return
 
+    cl.print("Configuration Status...")
     try:
+        # Only the stamp and the active files are checked on a normal launch,
+        # assets are compared after an upgrade or when a file was deleted
+        configFile = findConfigFile()
+        if not (
+            provisioningCurrent()
+            and fileExists(file=configFile)
+            and fileExists(file=DEFAULT_STYLE_FILE)
+        ):
+            provisionOnLaunch()
+            configFile = findConfigFile()
+
+        cl.print(statusTable(configFile))
+
+        try:
+            appConfig = AppConfig()
+        except FileException:
+            # The configuration file vanished after the checks above
+            provisionOnLaunch()
+            appConfig = AppConfig()
+
         cl.print("Starting GUI...")
-        window = Window()
+        applyRenderer(args.renderer or appConfig.renderer)
+        from hyprpwmenu.window import Window
+
+        # A profiled run must not be forwarded to a resident menu
+        window = Window(unique=not args.profile)
+        if not appConfig.readahead:
+            # The prefetch runs before the configuration is read, so drop its list
+            clearReadahead()
+        elif needsRecording():
+            startupFiles = [configFile, DEFAULT_STYLE_FILE]
+            startupFiles += [b.icon_path for b in appConfig.buttons]
+            window.firstFrameCallbacks.append(
+                lambda: recordStartupFiles(startupFiles)
+            )
+        if args.profile:
+            attachProfileStop(window, args.profileUntil)
         window.run()
     except Exception as e:
         showError(f"Error: {e}")
@@ -3,27 +3,122 @@ Configuration Management Module for HyprPwMenu
 
 This module handles configuration file management, including creation of default files
 and loading application settings. It uses the confz library for configuration management
-with YAML files and Pydantic for data validation.
+with TOML, JSON or YAML files and Pydantic for data validation.
 
 Classes:
+    ConfigFileSource: confz file source parsed by ConfigFileLoader
+    ConfigFileLoader: confz loader reading TOML with the standard library tomllib
+    Hook: Configuration model for a command run before a button command
     Button: Configuration model for individual power menu buttons
     AppConfig: Main application configuration containing button definitions
 
 Functions:
-    createConfigFile: Creates default configuration or style files if they don't exist
+    findConfigFile: Locate the configuration file in the configuration directory
+    convertConfigFile: Convert a configuration file to TOML or JSON
 
 Dependencies:
     - confz: Configuration management with YAML support
-    - importlib.resources: For accessing package assets
+    - json: JSON parsing and writing
     - os: File system operations
-    - sys: System-specific parameters and functions
+    - tomllib: TOML parsing from the standard library
 """
 
+import json
 import os
-from confz import BaseConfig, FileSource
-from .constants import APP_NAME
+import tomllib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Literal, TextIO
+from confz import BaseConfig, FileFormat, FileSource
+from confz.loaders import register_loader
+from confz.loaders.file_loader import FileLoader
+from pydantic import Field, model_validator
+from .constants import CONFIG_FILE_NAMES, DEFAULT_CONFIG_DIR
+from .util import writeFileAtomic
 
-from typing import List
+
+@dataclass
+class ConfigFileSource(FileSource):
+    """
+    confz file source for the HyprPwMenu configuration file.
+
+    Behaves like FileSource, but is loaded by ConfigFileLoader so TOML files
+    are parsed with the standard library instead of the `toml` package.
+    """
+
+
+class ConfigFileLoader(FileLoader):
+    """
+    confz loader for ConfigFileSource.
+
+    TOML is parsed with tomllib and JSON with json. Only YAML files are
+    handed to the PyYAML parser of the base FileLoader.
+    """
+
+    @classmethod
+    def _parse_stream(cls, stream: TextIO, file_format: FileFormat) -> dict:
+        if file_format == FileFormat.TOML:
+            return tomllib.loads(stream.read())
+        return super()._parse_stream(stream, file_format)
+
+    @classmethod
+    def loadFile(cls, path: Path) -> dict:
+        """
+        Parse a configuration file into a plain dictionary without validation.
+
+        Args:
+            path: Path to a .toml, .json, .yaml or .yml file
+
+        Returns:
+            dict: Raw configuration data
+        """
+        fileFormat = cls._get_format(path, None)
+        with cls._create_stream(path, "utf-8") as stream:
+            return cls._parse_stream(stream, fileFormat)
+
+
+register_loader(ConfigFileSource, ConfigFileLoader)
+
+
+def findConfigFile(configDir: str = DEFAULT_CONFIG_DIR) -> str:
+    """
+    Locate the configuration file in the given directory.
+
+    The names in CONFIG_FILE_NAMES are tried in order, so config.toml wins over
+    config.json, which wins over config.yaml.
+
+    Args:
+        configDir: Directory containing the configuration file
+
+    Returns:
+        str: Path of the first existing configuration file, or the path of
+        config.yaml if none exists
+    """
+    for name in CONFIG_FILE_NAMES:
+        path = os.path.join(configDir, name)
+        if os.path.isfile(path):
+            return path
+    return os.path.join(configDir, CONFIG_FILE_NAMES[-1])
+
+
+class Hook(BaseConfig):
+    """
+    Configuration model for a command run before a button command.
+
+    Attributes:
+        name (str): Unique name of the hook within its button
+        command (str): Shell command to run
+        after (List[str]): Names of hooks that must finish first
+        timeout (float): Seconds after which the hook is killed and fails
+
+    Example:
+        >>> hook = Hook(name="sync", command="sync", after=["lock"], timeout=10)
+    """
+
+    name: str  # unique name within the button
+    command: str  # shell command to run
+    after: List[str] = []  # hooks that must finish first
+    timeout: float = Field(default=30.0, gt=0)  # seconds
 
 
 class Button(BaseConfig):
@@ -38,7 +133,14 @@ class Button(BaseConfig):
         icon_path (str): Absolute path to PNG icon file for the button
         id (str): Unique CSS identifier for styling the button element
         hint (str): Tooltip text displayed when user hovers over the button
-        command (str): Shell command executed when the button is clicked
+        command (str): Shell command executed when the button is clicked, must
+            be empty for a button with children
+        children (List[Button]): Buttons of a sub-menu opened by this button
+            instead of running a command
+        pre_hooks (List[Hook]): Commands run before `command`, in parallel
+            where their `after` dependencies allow
+        hook_policy (str): "closed" cancels `command` if a hook fails,
+            "open" runs it anyway
 
     Example:
         >>> button = Button(
@@ -52,22 +154,90 @@ class Button(BaseConfig):
     icon_path: str  # path to png icon
     id: str  # identification for css
     hint: str  # tooltip hint
-    command: str  # command to run when clicked
+    command: str = ""  # command to run when clicked
+    children: List["Button"] = []  # sub-menu entries
+    pre_hooks: List[Hook] = []  # commands run before command
+    hook_policy: Literal["open", "closed"] = "closed"  # on hook failure
+
+    @model_validator(mode="after")
+    def checkHooks(self) -> "Button":
+        """
+        Check that the button has a command or children, that hook names are
+        unique and that hook dependencies form a DAG.
+
+        Raises:
+            ValueError: On a button without action or with both a command
+                and children, pre-hooks on a button with children, duplicate
+                hook names, unknown hook dependencies or cycles
+        """
+        if not self.command and not self.children:
+            raise ValueError(f"Button '{self.id}' needs a command or children")
+        if self.command and self.children:
+            # Opening the sub-menu would silently ignore the command
+            raise ValueError(f"Button '{self.id}' has both a command and children")
+        if self.children and self.pre_hooks:
+            # Opening a sub-menu runs no command, so its hooks would never run
+            raise ValueError(f"Button '{self.id}' has children and pre_hooks")
+
+        hooks = {hook.name: hook for hook in self.pre_hooks}
+        if len(hooks) != len(self.pre_hooks):
+            raise ValueError(f"Button '{self.id}' has duplicate hook names")
+        for hook in self.pre_hooks:
+            for dep in hook.after:
+                if dep not in hooks:
+                    raise ValueError(f"Hook '{hook.name}' depends on unknown '{dep}'")
+
+        # Depth-first search, a hook met again while still on the path is a cycle
+        visiting: set = set()
+        visited: set = set()
+
+        def visit(name: str) -> None:
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(
+                    f"Hooks of button '{self.id}' form a cycle at '{name}'"
+                )
+            visiting.add(name)
+            for dep in hooks[name].after:
+                visit(dep)
+            visiting.discard(name)
+            visited.add(name)
+
+        for name in hooks:
+            visit(name)
+        return self
+
+
+Button.model_rebuild()
 
 
 class AppConfig(BaseConfig):
     """
     Main application configuration containing all button definitions.
 
-    This class manages the overall application configuration loaded from YAML files.
-    It uses confz for automatic YAML parsing and validation.
+    This class manages the overall application configuration loaded from TOML,
+    JSON or YAML files. It uses confz for automatic parsing and validation.
 
     Attributes:
-        CONFIG_SOURCES: FileSource configuration pointing to the YAML config file
+        CONFIG_SOURCES: ConfigFileSource pointing to the configuration file
         buttons (List[Button]): List of Button objects defining power menu options
+        renderer (str): GSK renderer (auto, cairo, ngl or vulkan), "auto" uses
+            the renderer stored by `hyprpwmenu probe`
+        monitor_pool (bool): Pre-build one window per monitor and keep the
+            application resident, so later launches only show the window on
+            the focused monitor
+        usage_history (bool): Record button activations and focus the button
+            with the best decaying frequency score when the menu opens
+        usage_order (bool): Also order the buttons by that score
+        usage_half_life (float): Days after which the weight of an activation halves
+        hook_concurrency (int): Maximum number of pre-hooks running at once
+        readahead (bool): Record the files read during startup and prefetch
+            them on later launches
 
     Class Attributes:
-        CONFIG_SOURCES: Default configuration source pointing to ~/.config/hyprpwmenu/config.yaml
+        CONFIG_SOURCES: Default configuration source pointing to the file returned
+            by findConfigFile() for ~/.config/hyprpwmenu
 
     Example:
         >>> config = AppConfig()
@@ -79,12 +249,58 @@ class AppConfig(BaseConfig):
         to load configuration from a different file location.
     """
 
-    CONFIG_SOURCES = FileSource(
-        file=os.path.join(
-            os.path.expanduser(path="~"), ".config", f"{APP_NAME}", "config.yaml"
-        )
-    )
+    CONFIG_SOURCES = ConfigFileSource(file=findConfigFile())
     buttons: List[Button]
+    renderer: Literal["auto", "cairo", "ngl", "vulkan"] = "auto"  # GSK renderer
+    monitor_pool: bool = False  # one resident window per monitor
+    usage_history: bool = False  # focus the most used button first
+    usage_order: bool = False  # order buttons by usage
+    usage_half_life: float = Field(default=14.0, gt=0)  # days
+    hook_concurrency: int = Field(default=4, ge=1)  # parallel pre-hooks
+    readahead: bool = True  # prefetch startup files on cold starts
+
+
+def convertConfigFile(source: str, targetFormat: str, force: bool = False) -> str:
+    """
+    Convert a configuration file to TOML or JSON.
+
+    The source file is validated against AppConfig before anything is written,
+    and the converted file is written atomically next to the source as
+    config.toml or config.json. The source file is left untouched.
+
+    Args:
+        source: Path to the configuration file to convert
+        targetFormat: Either "toml" or "json"
+        force: Overwrite an existing target file
+
+    Returns:
+        str: Path of the written configuration file
+
+    Raises:
+        ValueError: If targetFormat is not supported or is the source format
+        FileExistsError: If the target file exists and force is False
+    """
+    if targetFormat not in ("toml", "json"):
+        raise ValueError(f"Unsupported configuration format: {targetFormat}")
+
+    sourcePath = Path(source).expanduser()
+    target = sourcePath.with_name(f"config.{targetFormat}")
+    if target.resolve() == sourcePath.resolve():
+        raise ValueError(f"{sourcePath} is already a {targetFormat} file")
+    if target.exists() and not force:
+        raise FileExistsError(f"{target} exists, use --force to overwrite it")
+
+    data = ConfigFileLoader.loadFile(sourcePath)
+    AppConfig(config_sources=ConfigFileSource(file=sourcePath))
+
+    if targetFormat == "toml":
+        import toml  # dependency of confz, only needed to write TOML
+
+        content = toml.dumps(data)
+    else:
+        content = json.dumps(data, indent=2) + "\n"
+    writeFileAtomic(str(target), content)
+    return str(target)
 
 
 if __name__ == "__main__":
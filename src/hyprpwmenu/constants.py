@@ -9,8 +9,19 @@ Constants:
     APP_VERSION (str): Current version of the application
     APP_NAME (str): Application name used for configuration directories
     DEFAULT_CONFIG_FILE (str): Default path for YAML configuration file
+    CONFIG_FILE_NAMES (Tuple[str, ...]): Supported configuration file names, in lookup order
     DEFAULT_STYLE_FILE (str): Default path for CSS style file
     SPACES_DEFAULT (int): Default spacing value for console output formatting
+    DEFAULT_CACHE_DIR (str): Cache directory for probe results
+    RENDERER_CACHE_FILE (str): Path of the renderer probe results
+    RENDERERS (Tuple[str, ...]): Selectable GSK renderers
+    HYPRLAND_IPC_TIMEOUT (float): Timeout in seconds of Hyprland IPC requests
+    USAGE_HISTORY_FILE (str): Path of the button usage history
+    READAHEAD_LIST_FILE (str): Path of the list of files read during startup
+    READAHEAD_BOOT_FILE (str): Path of the boot id of the last prefetch
+    PROVISIONED_ASSETS (Tuple[str, ...]): Assets installed into the config directory
+    ASSET_MANIFEST (str): Name of the packaged asset hash manifest
+    ASSET_STAMP (str): Name of the record of installed asset hashes
 
 
 """
@@ -32,8 +43,52 @@ DEFAULT_CONFIG_DIR = os.path.join(
 #: Default path for the YAML configuration file containing button definitions
 DEFAULT_CONFIG_FILE = os.path.join(DEFAULT_CONFIG_DIR, "config.yaml")
 
+#: Supported configuration file names, in lookup order (fastest parser first)
+CONFIG_FILE_NAMES = ("config.toml", "config.json", "config.yaml")
+
 #: Default path for the CSS style file containing visual theme definitions
 DEFAULT_STYLE_FILE = os.path.join(DEFAULT_CONFIG_DIR, "style.css")
 
+#: Packaged assets installed into the configuration directory
+PROVISIONED_ASSETS = (
+    "config.yaml",
+    "style.css",
+    "logoff.png",
+    "reboot.png",
+    "shutdown.png",
+)
+
+#: Name of the hash manifest stored next to the packaged assets
+ASSET_MANIFEST = "manifest.json"
+
+#: Name of the record of asset hashes installed into the configuration directory
+ASSET_STAMP = ".assets.json"
+
 #: Default spacing value used for console output formatting in utility functions
 SPACES_DEFAULT = 15
+
+#: Cache directory for data computed by the application (renderer probe results)
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get(
+        "XDG_CACHE_HOME", os.path.join(os.path.expanduser(path="~"), ".cache")
+    ),
+    f"{APP_NAME}",
+)
+
+#: Path of the file storing the renderer probe results
+RENDERER_CACHE_FILE = os.path.join(DEFAULT_CACHE_DIR, "renderer.json")
+
+#: Path of the file recording how often and how recently each button was used
+USAGE_HISTORY_FILE = os.path.join(DEFAULT_CACHE_DIR, "usage.json")
+
+#: Path of the list of files read during startup, prefetched on later launches
+READAHEAD_LIST_FILE = os.path.join(DEFAULT_CACHE_DIR, "readahead.list")
+
+#: Path of the boot id of the last prefetch, so only the first launch of a boot prefetches
+READAHEAD_BOOT_FILE = os.path.join(DEFAULT_CACHE_DIR, "readahead.boot")
+
+#: GSK renderers that can be selected, "auto" uses the probed renderer
+RENDERERS = ("auto", "cairo", "ngl", "vulkan")
+
+#: Timeout in seconds of Hyprland IPC socket requests
+HYPRLAND_IPC_TIMEOUT = 0.2
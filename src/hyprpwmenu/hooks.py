@@ -0,0 +1,262 @@
+"""
+Pre-action Hook Pipeline Module for HyprPwMenu
+
+This module runs the pre-hooks of a button before its command. Hooks form a
+dependency graph through their `after` lists and run in parallel up to a
+concurrency limit, each one with its own timeout.
+
+A hook whose dependency did not succeed is skipped. With the "closed" policy
+no new hook starts after the first failure and the button command must not
+run; with the "open" policy failures are only reported.
+
+A run can be cancelled through a HookCancel handle, e.g. when the menu is
+closed: running hooks are killed right away and no new hook starts.
+
+Classes:
+    HookResult: Outcome and duration of one hook
+    HookCancel: Cancellation handle of a pipeline run
+
+Functions:
+    killProcessGroup: Kill a hook command together with everything it started
+    runHook: Run one hook command with its timeout
+    runHooks: Run hooks as a dependency graph with a concurrency limit
+    hooksSucceeded: Whether the button command may run after the hooks
+    hookSummary: Timing summary lines of a pipeline run
+"""
+
+import os
+import signal
+import subprocess
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, NamedTuple, Optional
+from hyprpwmenu.config import Hook
+
+
+class HookResult(NamedTuple):
+    """
+    Outcome and duration of one hook.
+
+    Attributes:
+        name (str): Name of the hook
+        status (str): "ok", "failed", "timeout", "cancelled" or "skipped"
+        duration (float): Run time in seconds, 0 for skipped hooks
+        returncode (Optional[int]): Exit code, None if the hook did not finish
+    """
+
+    name: str
+    status: str
+    duration: float = 0.0
+    returncode: Optional[int] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "ok"
+
+
+def killProcessGroup(process: subprocess.Popen) -> None:
+    """
+    Kill a hook command together with everything it started.
+
+    Args:
+        process: Hook process, started as the leader of its own process group
+    """
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass  # the group already exited
+
+
+class HookCancel:
+    """
+    Cancellation handle of a pipeline run.
+
+    Hook processes register here while they run, so cancel() can kill them
+    from the GTK main thread without waiting for the worker threads.
+
+    Attributes:
+        cancelled (bool): cancel() was called
+    """
+
+    def __init__(self) -> None:
+        self.cancelled = False
+        self.processes: set = set()
+        self.lock = threading.Lock()
+
+    def register(self, process: subprocess.Popen) -> bool:
+        """
+        Track a started hook process.
+
+        Args:
+            process: The hook process
+
+        Returns:
+            bool: False if the run was already cancelled, the caller must
+            kill the process
+        """
+        with self.lock:
+            if self.cancelled:
+                return False
+            self.processes.add(process)
+            return True
+
+    def unregister(self, process: subprocess.Popen) -> None:
+        """
+        Stop tracking a finished hook process.
+
+        Args:
+            process: The hook process
+        """
+        with self.lock:
+            self.processes.discard(process)
+
+    def cancel(self) -> None:
+        """
+        Cancel the run and kill the process groups of the running hooks.
+        """
+        with self.lock:
+            self.cancelled = True
+            for process in self.processes:
+                killProcessGroup(process)
+
+
+def runHook(hook: Hook, cancel: Optional[HookCancel] = None) -> HookResult:
+    """
+    Run one hook command with its timeout.
+
+    The command runs in its own process group, so a timeout or a cancellation
+    kills the shell together with everything it started. A command that
+    cannot be started fails instead of raising.
+
+    Args:
+        hook: The hook to run
+        cancel: Cancellation handle of the run
+
+    Returns:
+        HookResult: Outcome of the hook
+    """
+    start = time.perf_counter()
+    try:
+        process = subprocess.Popen(
+            hook.command,
+            shell=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        return HookResult(hook.name, "failed", time.perf_counter() - start)
+
+    if cancel is not None and not cancel.register(process):
+        killProcessGroup(process)
+        process.wait()
+        return HookResult(hook.name, "cancelled", time.perf_counter() - start)
+
+    try:
+        returncode = process.wait(timeout=hook.timeout)
+    except subprocess.TimeoutExpired:
+        killProcessGroup(process)
+        process.wait()
+        return HookResult(hook.name, "timeout", time.perf_counter() - start)
+    finally:
+        if cancel is not None:
+            cancel.unregister(process)
+
+    if cancel is not None and cancel.cancelled:
+        return HookResult(hook.name, "cancelled", time.perf_counter() - start)
+    status = "ok" if returncode == 0 else "failed"
+    return HookResult(hook.name, status, time.perf_counter() - start, returncode)
+
+
+def runHooks(
+    hooks: List[Hook],
+    concurrency: int,
+    policy: str,
+    onProgress: Optional[Callable[[List[str], int, int], None]] = None,
+    cancel: Optional[HookCancel] = None,
+) -> List[HookResult]:
+    """
+    Run hooks as a dependency graph with a concurrency limit.
+
+    A hook starts once every hook in its `after` list has finished. Blocking,
+    so it is meant to be called from a worker thread.
+
+    Args:
+        hooks: Hooks to run, validated to form an acyclic graph
+        concurrency: Maximum number of hooks running at the same time
+        policy: "open" or "closed", see the module documentation
+        onProgress: Called with the names of the running hooks, the number of
+            finished hooks and the total whenever a hook starts or finishes
+        cancel: Cancellation handle, hooks not started yet are skipped once
+            it is cancelled
+
+    Returns:
+        List[HookResult]: Result of every hook, in completion order
+    """
+    pending = {hook.name: hook for hook in hooks}
+    results: Dict[str, HookResult] = {}
+    running: Dict[Future, Hook] = {}
+
+    def report() -> None:
+        if onProgress is not None:
+            names = [hook.name for hook in running.values()]
+            onProgress(names, len(results), len(hooks))
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        while pending or running:
+            aborted = (cancel is not None and cancel.cancelled) or (
+                policy == "closed" and any(not r.ok for r in results.values())
+            )
+            for name, hook in list(pending.items()):
+                if aborted or any(
+                    dep in results and not results[dep].ok for dep in hook.after
+                ):
+                    del pending[name]
+                    results[name] = HookResult(name, "skipped")
+                elif len(running) < concurrency and all(
+                    dep in results for dep in hook.after
+                ):
+                    del pending[name]
+                    running[pool.submit(runHook, hook, cancel)] = hook
+            report()
+
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                hook = running.pop(future)
+                results[hook.name] = future.result()
+
+    report()
+    return list(results.values())
+
+
+def hooksSucceeded(results: List[HookResult], policy: str) -> bool:
+    """
+    Whether the button command may run after the hooks.
+
+    Args:
+        results: Results returned by runHooks
+        policy: "open" or "closed"
+
+    Returns:
+        bool: True if every hook succeeded or the policy is "open"
+    """
+    return policy == "open" or all(result.ok for result in results)
+
+
+def hookSummary(results: List[HookResult]) -> List[str]:
+    """
+    Timing summary lines of a pipeline run, slowest hook first.
+
+    Args:
+        results: Results returned by runHooks
+
+    Returns:
+        List[str]: One line per hook
+    """
+    return [
+        f"{result.name:<20} {result.status:<8} {result.duration * 1000:>8.1f} ms"
+        for result in sorted(results, key=lambda r: r.duration, reverse=True)
+    ]
@@ -0,0 +1,250 @@
+"""
+Profiling Module for HyprPwMenu
+
+This module runs the whole application entry point under cProfile or a
+stack sampler, so slow startups can be compared across machines and releases.
+It only depends on the standard library, which keeps the profiled path free
+of imports done on behalf of the profiler itself.
+
+Only one profiler runs at a time: the per-call overhead of cProfile would
+skew the sampled stacks, and the sampler taking the GIL every interval would
+inflate the cProfile timings. Files written per run to the profile directory:
+    <name>.pstats: Statistics readable with `python -m pstats` or snakeviz.
+        With the sampler they are aggregated from the samples: times are
+        estimated from sample counts and call counts are sample counts.
+        With cProfile they are exact.
+    <name>.collapsed: Sampled stacks in the collapsed format used by
+        flamegraph.pl, inferno and speedscope. Only written by the sampler,
+        cProfile records callers but not whole stacks.
+
+Classes:
+    StackSampler: Thread sampling the stack of another thread
+
+Functions:
+    argvOption: Find the value of an option in the command line
+    runProfiled: Run a callable under cProfile or the stack sampler
+    attachProfileStop: Quit the window after the first frame or the first action
+"""
+
+import cProfile
+import marshal
+import os
+import socket
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+from typing import Callable, Dict, List, Optional, Tuple
+from hyprpwmenu.constants import APP_NAME, APP_VERSION
+
+#: Interval in seconds between two stack samples
+SAMPLE_INTERVAL = 0.001
+
+#: Points at which a profiled run stops
+PROFILE_STOPS = ("first-frame", "action")
+
+#: Profilers selectable with --profiler, the first one is the default
+PROFILERS = ("sample", "cprofile")
+
+#: A function as identified by pstats: file name, first line and name
+FunctionKey = Tuple[str, int, str]
+
+
+class StackSampler(threading.Thread):
+    """
+    Thread sampling the stack of another thread at a fixed interval.
+
+    Attributes:
+        threadId (int): Identifier of the sampled thread
+        interval (float): Seconds between two samples
+        counts (Counter): Number of samples of each stack, keyed by the
+            tuple of its functions, outermost first
+        elapsed (float): Seconds spent sampling
+    """
+
+    def __init__(self, threadId: int, interval: float = SAMPLE_INTERVAL) -> None:
+        super().__init__(name=f"{APP_NAME}-sampler", daemon=True)
+        self.threadId = threadId
+        self.interval = interval
+        self.counts: Counter = Counter()
+        self.elapsed = 0.0
+        self.stopped = threading.Event()
+
+    def run(self) -> None:
+        start = time.perf_counter()
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.threadId)
+            if frame is not None:
+                self.counts[self.stackKeys(frame)] += 1
+        self.elapsed = time.perf_counter() - start
+
+    @staticmethod
+    def stackKeys(frame: Optional[FrameType]) -> Tuple[FunctionKey, ...]:
+        """
+        Identify the functions of a stack.
+
+        Only code objects are read while sampling, formatting happens when
+        the samples are written.
+
+        Args:
+            frame: Innermost frame of the stack
+
+        Returns:
+            Tuple[FunctionKey, ...]: One key per frame, outermost first
+        """
+        keys: List[FunctionKey] = []
+        while frame is not None:
+            code = frame.f_code
+            keys.append((code.co_filename, code.co_firstlineno, code.co_qualname))
+            frame = frame.f_back
+        return tuple(reversed(keys))
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the thread to finish."""
+        self.stopped.set()
+        self.join()
+
+    def write(self, path: str) -> None:
+        """
+        Write the samples in collapsed stack format.
+
+        Args:
+            path: Destination file
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.counts.most_common():
+                names = (f"{name} ({file}:{line})" for file, line, name in stack)
+                f.write(f"{';'.join(names)} {count}\n")
+
+    def writeStats(self, path: str) -> None:
+        """
+        Write the samples aggregated per function in the pstats file format.
+
+        Own time counts the samples where a function is the leaf, cumulative
+        time the samples where it is anywhere on the stack (once, even when
+        recursive). Each sample stands for elapsed / total samples seconds,
+        and the call counts are sample counts.
+
+        Args:
+            path: Destination file
+        """
+        total = sum(self.counts.values())
+        perSample = self.elapsed / total if total else self.interval
+        # function -> [calls, own samples, cumulative samples, callers]
+        stats: Dict[FunctionKey, list] = {}
+        for stack, count in self.counts.items():
+            seen = set()
+            for depth, key in enumerate(stack):
+                entry = stats.setdefault(key, [0, 0, 0, Counter()])
+                if key not in seen:
+                    seen.add(key)
+                    entry[0] += count
+                    entry[2] += count
+                if depth == len(stack) - 1:
+                    entry[1] += count
+                if depth > 0:
+                    entry[3][stack[depth - 1]] += count
+
+        data = {}
+        for key, (calls, own, cumulative, callers) in stats.items():
+            data[key] = (
+                calls,
+                calls,
+                own * perSample,
+                cumulative * perSample,
+                {
+                    caller: (n, n, 0.0, n * perSample)
+                    for caller, n in callers.items()
+                },
+            )
+        with open(path, "wb") as f:
+            marshal.dump(data, f)
+
+
+def argvOption(argv: List[str], option: str) -> Optional[str]:
+    """
+    Find the value of an option in the command line.
+
+    Scanned before argparse runs, so profiling can start before the CLI
+    module and its dependencies are imported.
+
+    Args:
+        argv: Command line arguments without the program name
+        option: Option name, e.g. "--profile"
+
+    Returns:
+        Optional[str]: The value of the option, or None if it is not given
+    """
+    for i, arg in enumerate(argv):
+        if arg.startswith(f"{option}="):
+            return arg.split("=", 1)[1]
+        if arg == option and i + 1 < len(argv):
+            return argv[i + 1]
+    return None
+
+
+def runProfiled(
+    target: Callable[[], None], outputDir: str, profiler: str = PROFILERS[0]
+) -> None:
+    """
+    Run a callable under cProfile or the stack sampler.
+
+    The profile files are written even if the callable exits with SystemExit.
+    Their names contain the application version, the host name and the start
+    time, so profiles from several machines can share one directory.
+
+    Args:
+        target: The callable to profile
+        outputDir: Directory receiving the .pstats and .collapsed files
+        profiler: One of PROFILERS
+    """
+    os.makedirs(outputDir, exist_ok=True)
+    name = (
+        f"{APP_NAME}-{APP_VERSION}-{socket.gethostname()}-"
+        f"{time.strftime('%Y%m%d-%H%M%S')}"
+    )
+    basePath = os.path.join(outputDir, name)
+
+    if profiler == "cprofile":
+        profile = cProfile.Profile()
+        paths = [f"{basePath}.pstats"]
+        profile.enable()
+        try:
+            target()
+        finally:
+            profile.disable()
+            profile.dump_stats(paths[0])
+    else:
+        sampler = StackSampler(threading.get_ident())
+        paths = [f"{basePath}.pstats", f"{basePath}.collapsed"]
+        sampler.start()
+        try:
+            target()
+        finally:
+            sampler.stop()
+            sampler.writeStats(paths[0])
+            sampler.write(paths[1])
+
+    # Imported here so rich is not loaded on behalf of the profiler
+    from hyprpwmenu.util import showStatus
+
+    showStatus("PROFILE", " and ".join(paths))
+
+
+def attachProfileStop(window, until: str) -> None:
+    """
+    Quit the window after the first frame or the first action.
+
+    With "first-frame" the application quits once the menu was painted.
+    With "action" it quits when a button is activated, and the command of the
+    button is logged instead of run.
+
+    Args:
+        window: HyprPwMenu Window instance, before it runs
+        until: One of PROFILE_STOPS
+    """
+    if until == "action":
+        window.dryRun = True
+    else:
+        window.firstFrameCallbacks.append(window.app.quit)
@@ -0,0 +1,239 @@
+"""
+Asset Provisioning Module for HyprPwMenu
+
+This module installs the packaged assets (default configuration, style and
+icons) into the configuration directory and keeps them up to date without
+ever overwriting user edits.
+
+The packaged manifest.json, stored next to the assets, holds the SHA-256 of
+each asset and the hashes of every earlier shipped version of it. The
+configuration directory holds a stamp (.assets.json) with the application
+version and the hash of every asset as it was installed. A file is only
+replaced when it is missing, still identical to what was installed or
+identical to an earlier shipped version, i.e. unmodified but outdated. The
+shipped hashes also cover installs made before the stamp existed, as far as
+the history reaches: it starts with the first release that had a manifest.
+Every write goes through a temporary file and an atomic rename.
+
+Run `python -m hyprpwmenu.provision [REVISION ...]` after changing an asset:
+the previous manifest entries move to the history, together with the assets
+found at the given git revisions.
+
+A normal launch only reads the stamp and compares its version, the full
+comparison runs after an upgrade or through `hyprpwmenu init`.
+
+Classes:
+    AssetStatus: Outcome of provisioning one asset
+
+Functions:
+    fileDigest: SHA-256 of a file
+    gitAssetDigests: SHA-256 of the assets at a git revision
+    buildManifest: Compute the packaged manifest from the assets
+    loadPackagedManifest: Read the manifest stored next to the assets
+    provisioningCurrent: Whether the stamp matches the running version
+    provisionAssets: Install missing and unmodified outdated assets
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set
+from hyprpwmenu.config import findConfigFile
+from hyprpwmenu.constants import (
+    APP_VERSION,
+    ASSET_MANIFEST,
+    ASSET_STAMP,
+    DEFAULT_CONFIG_DIR,
+    PROVISIONED_ASSETS,
+)
+from hyprpwmenu.util import copyAssetFile, readAssetFile, writeFileAtomic
+
+
+class AssetStatus(NamedTuple):
+    """
+    Outcome of provisioning one asset.
+
+    Attributes:
+        asset (str): File name of the asset
+        path (str): Path of the asset in the configuration directory
+        status (str): "installed", "updated", "current", "modified" (kept
+            because the user edited it) or "skipped" (config.yaml while a
+            TOML or JSON configuration is used)
+    """
+
+    asset: str
+    path: str
+    status: str
+
+
+def fileDigest(path: str) -> Optional[str]:
+    """
+    SHA-256 of a file.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Optional[str]: Hex digest, or None if the file cannot be read
+    """
+    try:
+        with open(path, "rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+    except OSError:
+        return None
+
+
+def gitAssetDigests(revision: str) -> Dict[str, str]:
+    """
+    SHA-256 of the assets at a git revision of this repository.
+
+    Args:
+        revision: Any revision understood by `git show`
+
+    Returns:
+        Dict[str, str]: Digest of each provisioned asset present at the revision
+    """
+    digests = {}
+    for asset in PROVISIONED_ASSETS:
+        result = subprocess.run(
+            ["git", "show", f"{revision}:src/hyprpwmenu/assets/{asset}"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        if result.returncode == 0:
+            digests[asset] = hashlib.sha256(result.stdout).hexdigest()
+    return digests
+
+
+def buildManifest(
+    previous: Optional[Dict[str, object]] = None, revisions: Iterable[str] = ()
+) -> Dict[str, object]:
+    """
+    Compute the packaged manifest from the assets.
+
+    Args:
+        previous: Manifest being replaced, its hashes are kept in the history
+        revisions: Git revisions whose assets are added to the history
+
+    Returns:
+        Dict[str, object]: Version, SHA-256 of each provisioned asset and the
+        SHA-256 of each earlier shipped version of it
+    """
+    files = {
+        asset: hashlib.sha256(readAssetFile(asset)).hexdigest()
+        for asset in PROVISIONED_ASSETS
+    }
+
+    shipped: Dict[str, Set[str]] = {asset: set() for asset in PROVISIONED_ASSETS}
+    sources = [gitAssetDigests(revision) for revision in revisions]
+    if previous:
+        sources.append(previous.get("files", {}))
+        for asset, digests in previous.get("history", {}).items():
+            shipped.setdefault(asset, set()).update(digests)
+    for source in sources:
+        for asset, digest in source.items():
+            shipped.setdefault(asset, set()).add(digest)
+
+    history = {asset: sorted(shipped[asset] - {files[asset]}) for asset in files}
+    return {"version": APP_VERSION, "files": files, "history": history}
+
+
+def loadPackagedManifest() -> Dict[str, object]:
+    """
+    Read the manifest stored next to the assets.
+
+    Returns:
+        Dict[str, object]: "files" with the SHA-256 of each provisioned asset
+        and "history" with the SHA-256 of its earlier shipped versions
+    """
+    return json.loads(readAssetFile(ASSET_MANIFEST))
+
+
+def loadStamp(stampPath: str) -> Dict[str, object]:
+    """
+    Read the stamp of installed assets.
+
+    Args:
+        stampPath: Path of the stamp file
+
+    Returns:
+        Dict[str, object]: Stamp content, empty if missing or unreadable
+    """
+    try:
+        with open(stampPath, encoding="utf-8") as f:
+            stamp = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return stamp if isinstance(stamp, dict) else {}
+
+
+def provisioningCurrent(configDir: str = DEFAULT_CONFIG_DIR) -> bool:
+    """
+    Whether the stamp was written by the running version.
+
+    This is the only check done on a normal launch.
+
+    Args:
+        configDir: Configuration directory
+
+    Returns:
+        bool: True if provisionAssets has nothing to do
+    """
+    stamp = loadStamp(os.path.join(configDir, ASSET_STAMP))
+    return stamp.get("version") == APP_VERSION
+
+
+def provisionAssets(configDir: str = DEFAULT_CONFIG_DIR) -> List[AssetStatus]:
+    """
+    Install missing and unmodified outdated assets, then write the stamp.
+
+    Args:
+        configDir: Configuration directory
+
+    Returns:
+        List[AssetStatus]: Outcome of each asset
+    """
+    stampPath = os.path.join(configDir, ASSET_STAMP)
+    installed = dict(loadStamp(stampPath).get("files", {}))
+    manifest = loadPackagedManifest()
+    shipped = manifest.get("history", {})
+    statuses = []
+
+    for asset, packaged in manifest["files"].items():
+        path = os.path.join(configDir, asset)
+        current = fileDigest(path)
+
+        if current == packaged:
+            status = "current"
+        elif current is None and asset == "config.yaml":
+            # A config.toml or config.json makes the default YAML unnecessary
+            usesOtherFormat = findConfigFile(configDir) != path
+            status = "skipped" if usesOtherFormat else "installed"
+        elif current is None:
+            status = "installed"
+        elif installed.get(asset) == current or current in shipped.get(asset, ()):
+            status = "updated"
+        else:
+            status = "modified"
+
+        if status in ("installed", "updated"):
+            copyAssetFile(destination=configDir, asset=asset)
+        if status != "modified":
+            installed[asset] = packaged
+        statuses.append(AssetStatus(asset, path, status))
+
+    stamp = {"version": APP_VERSION, "files": installed}
+    writeFileAtomic(stampPath, json.dumps(stamp, indent=2) + "\n")
+    return statuses
+
+
+if __name__ == "__main__":
+    # Regenerate the packaged manifest after changing an asset
+    import sys
+    from importlib.resources import files
+
+    manifestPath = str(files("hyprpwmenu").joinpath(f"assets/{ASSET_MANIFEST}"))
+    manifest = buildManifest(loadPackagedManifest(), sys.argv[1:])
+    with open(manifestPath, "w", encoding="utf-8") as f:
+        f.write(json.dumps(manifest, indent=2) + "\n")
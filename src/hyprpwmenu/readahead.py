@@ -0,0 +1,227 @@
+"""
+Startup Readahead Module for HyprPwMenu
+
+On the first launch after boot the page cache is cold and startup is spent in
+scattered reads of Python modules, shared libraries, GObject typelibs, icons
+and the style file. This module records the files the process used once its
+first frame was painted, and on the first launch of each later boot asks
+the kernel to read them all ahead with posix_fadvise(WILLNEED) from a
+background thread, while the main thread is still importing. Warm launches
+find everything in the page cache already and skip the prefetch.
+
+The list is a text file with one path per line, preceded by a header line
+naming the version that recorded it, so upgrades record a fresh list. The
+boot id of the last prefetch is kept in a separate file next to it.
+
+It only depends on the standard library, so it can run first in main().
+
+Functions:
+    loadReadaheadList: Read the recorded file list
+    bootId: Identifier of the running boot
+    prefetchFiles: Issue readahead for a list of files
+    prefetchOnce: Prefetch files unless it was already done during this boot
+    startReadahead: Prefetch the recorded files from a background thread
+    needsRecording: Whether the file list is missing or outdated
+    recordStartupFiles: Record the files used by the running process
+    clearReadahead: Delete the recorded file list and boot id
+"""
+
+import os
+import sys
+import threading
+from typing import Iterable, List, Optional
+from hyprpwmenu.constants import (
+    APP_NAME,
+    APP_VERSION,
+    READAHEAD_BOOT_FILE,
+    READAHEAD_LIST_FILE,
+)
+
+#: Kernel file holding a random identifier generated at every boot
+BOOT_ID_FILE = "/proc/sys/kernel/random/boot_id"
+
+#: Header line identifying the version that recorded the list
+LIST_HEADER = f"# {APP_NAME} {APP_VERSION}"
+
+
+def loadReadaheadList(path: str = READAHEAD_LIST_FILE) -> Optional[List[str]]:
+    """
+    Read the recorded file list.
+
+    Args:
+        path: Path of the list file
+
+    Returns:
+        Optional[List[str]]: Recorded paths, or None if the list is missing or
+        was recorded by another version
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return None
+    if not lines or lines[0] != LIST_HEADER:
+        return None
+    return lines[1:]
+
+
+def bootId() -> Optional[str]:
+    """
+    Identifier of the running boot.
+
+    Returns:
+        Optional[str]: The kernel boot id, or None where it is not available
+    """
+    try:
+        with open(BOOT_ID_FILE, encoding="utf-8") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def prefetchFiles(paths: Iterable[str]) -> None:
+    """
+    Issue readahead for a list of files.
+
+    posix_fadvise(WILLNEED) queues the reads in the kernel; it may block while
+    submitting them, which is why startReadahead calls it from a thread.
+
+    Args:
+        paths: Files to prefetch, missing files are ignored
+    """
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def prefetchOnce(paths: List[str], boot: str, bootPath: str) -> None:
+    """
+    Record the boot id, then issue readahead for a list of files.
+
+    The boot id is written first, so a launch racing this one does not
+    prefetch the same files again. A torn write only costs one more prefetch.
+
+    Args:
+        paths: Files to prefetch
+        boot: Identifier of the running boot
+        bootPath: Path of the boot id file
+    """
+    try:
+        with open(bootPath, "w", encoding="utf-8") as f:
+            f.write(f"{boot}\n")
+    except OSError:
+        pass
+    prefetchFiles(paths)
+
+
+def startReadahead(
+    path: str = READAHEAD_LIST_FILE, bootPath: str = READAHEAD_BOOT_FILE
+) -> Optional[threading.Thread]:
+    """
+    Prefetch the recorded files from a background thread.
+
+    Only the first launch after each boot prefetches; later launches find
+    the files in the page cache. Without a boot id every launch prefetches.
+
+    Args:
+        path: Path of the list file
+        bootPath: Path of the boot id of the last prefetch
+
+    Returns:
+        Optional[threading.Thread]: The prefetch thread, None if there is no
+        usable list, the files were already prefetched during this boot or
+        the platform lacks posix_fadvise
+    """
+    paths = loadReadaheadList(path)
+    if not paths or not hasattr(os, "posix_fadvise"):
+        return None
+
+    boot = bootId()
+    if boot is None:
+        target, args = prefetchFiles, (paths,)
+    else:
+        try:
+            with open(bootPath, encoding="utf-8") as f:
+                if f.read().strip() == boot:
+                    return None
+        except OSError:
+            pass
+        target, args = prefetchOnce, (paths, boot, bootPath)
+
+    thread = threading.Thread(
+        target=target, args=args, name=f"{APP_NAME}-readahead", daemon=True
+    )
+    thread.start()
+    return thread
+
+
+def needsRecording(path: str = READAHEAD_LIST_FILE) -> bool:
+    """
+    Whether the file list is missing or was recorded by another version.
+
+    Args:
+        path: Path of the list file
+
+    Returns:
+        bool: True if recordStartupFiles should run
+    """
+    return loadReadaheadList(path) is None
+
+
+def recordStartupFiles(extra: Iterable[str], path: str = READAHEAD_LIST_FILE) -> None:
+    """
+    Record the files used by the running process.
+
+    Collects the source and bytecode files of every imported module and every
+    file mapped into the process (shared libraries, typelibs, fonts), plus
+    the given extra files such as the style file and icons.
+
+    Args:
+        extra: Additional files read at startup
+        path: Path of the list file
+    """
+    from hyprpwmenu.util import writeFileAtomic
+
+    paths = set(os.path.expanduser(p) for p in extra)
+    for module in list(sys.modules.values()):
+        for attribute in ("__file__", "__cached__"):
+            value = getattr(module, attribute, None)
+            if isinstance(value, str):
+                paths.add(value)
+
+    try:
+        with open("/proc/self/maps", encoding="utf-8") as maps:
+            for line in maps:
+                fields = line.split(maxsplit=5)
+                if len(fields) == 6 and fields[5].startswith("/"):
+                    paths.add(fields[5].rstrip("\n"))
+    except OSError:
+        pass
+
+    files = sorted(p for p in paths if os.path.isfile(p))
+    writeFileAtomic(path, "\n".join([LIST_HEADER, *files]) + "\n")
+
+
+def clearReadahead(
+    path: str = READAHEAD_LIST_FILE, bootPath: str = READAHEAD_BOOT_FILE
+) -> None:
+    """
+    Delete the recorded file list and boot id, turning the prefetch off.
+
+    Args:
+        path: Path of the list file
+        bootPath: Path of the boot id file
+    """
+    for file in (path, bootPath):
+        try:
+            os.remove(file)
+        except FileNotFoundError:
+            pass
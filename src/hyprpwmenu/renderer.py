@@ -0,0 +1,293 @@
+"""
+GSK Renderer Selection Module for HyprPwMenu
+
+This module selects the GSK renderer used to draw the power menu and measures
+the startup latency of each renderer. GTK reads the GSK_RENDERER environment
+variable the first time a surface is realized, so the renderer must be applied
+before the GTK application starts.
+
+Functions:
+    loadProbedRenderer: Read the fastest renderer stored by the last probe
+    resolveRenderer: Turn a renderer setting into a concrete renderer name
+    applyRenderer: Export the renderer through GSK_RENDERER
+    probeRenderers: Measure every renderer and store the fastest one
+    probeChild: Entry point of the probe subprocess
+
+Classes:
+    FrameProbe: Records time-to-first-frame and frame times of a window
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+from hyprpwmenu.constants import RENDERER_CACHE_FILE, RENDERERS
+from hyprpwmenu.util import printLog, writeFileAtomic
+
+#: Number of frames drawn by the probe subprocess for each renderer
+PROBE_FRAMES = 60
+
+#: Number of timed probe runs of each renderer, the median is kept
+PROBE_RUNS = 5
+
+#: Seconds after which a probe subprocess is considered hung
+PROBE_TIMEOUT = 15
+
+#: Substring of the GskRenderer type name expected for each renderer
+RENDERER_TYPE_NAMES = {"cairo": "cairo", "ngl": "gl", "vulkan": "vulkan"}
+
+
+def loadProbedRenderer() -> Optional[str]:
+    """
+    Read the fastest renderer stored by the last probe.
+
+    Returns:
+        Optional[str]: Renderer name, or None if no probe result is cached
+    """
+    try:
+        with open(RENDERER_CACHE_FILE, encoding="utf-8") as f:
+            renderer = json.load(f).get("renderer")
+    except (OSError, ValueError):
+        return None
+    return renderer if renderer in RENDERERS[1:] else None
+
+
+def resolveRenderer(renderer: str) -> Optional[str]:
+    """
+    Turn a renderer setting into a concrete renderer name.
+
+    Args:
+        renderer: One of RENDERERS
+
+    Returns:
+        Optional[str]: The renderer to use, or None to let GTK decide. "auto"
+        resolves to the probed renderer, or None if GSK_RENDERER is already
+        set or no probe result exists.
+    """
+    if renderer != "auto":
+        return renderer
+    if os.environ.get("GSK_RENDERER"):
+        return None
+    return loadProbedRenderer()
+
+
+def applyRenderer(renderer: str) -> None:
+    """
+    Export the renderer through GSK_RENDERER.
+
+    Must be called before the GTK application realizes its first window.
+
+    Args:
+        renderer: One of RENDERERS
+    """
+    resolved = resolveRenderer(renderer)
+    if resolved is None:
+        printLog("Using the GSK renderer chosen by GTK")
+        return
+    printLog(f"Using the '{resolved}' GSK renderer")
+    os.environ["GSK_RENDERER"] = resolved
+
+
+class FrameProbe:
+    """
+    Records time-to-first-frame and frame times of a window.
+
+    The probe keeps the window redrawing until `frames` frames were painted,
+    then prints the result as a JSON line on stdout and quits the application.
+
+    Attributes:
+        window (Window): HyprPwMenu window being measured
+        start (float): perf_counter() value the first frame is measured from
+        frames (int): Number of frames to measure
+        frameTimes (List[float]): Duration of each frame, from before-paint to
+            after-paint
+    """
+
+    def __init__(self, window, start: float, frames: int) -> None:
+        self.window = window
+        self.start = start
+        self.frames = frames
+        self.firstFrame: Optional[float] = None
+        self.frameStart = 0.0
+        self.frameTimes: List[float] = []
+
+    def attach(self, app) -> None:
+        """
+        Start measuring once the window of the application exists.
+
+        Connected to the "activate" signal after Window.on_activate.
+
+        Args:
+            app: The GTK4 application instance
+        """
+        self.window.window.add_tick_callback(self.onTick)
+
+    def onTick(self, widget, frameClock) -> bool:
+        """
+        Connect the paint signals of the frame clock on the first tick.
+
+        Args:
+            widget: The window being measured
+            frameClock: Frame clock of the window
+
+        Returns:
+            bool: False, so the tick callback is removed after one call
+        """
+        frameClock.connect("before-paint", self.onBeforePaint)
+        frameClock.connect("after-paint", self.onAfterPaint)
+        return False
+
+    def onBeforePaint(self, frameClock) -> None:
+        """
+        Remember when the painting of a frame starts.
+
+        Args:
+            frameClock: Frame clock of the window
+        """
+        self.frameStart = time.perf_counter()
+
+    def onAfterPaint(self, frameClock) -> None:
+        """
+        Record a painted frame, then request the next one or report and quit.
+
+        The first frame is recorded as time-to-first-frame, every later one
+        as a frame time. Once `frames` frame times are recorded the result is
+        printed and the application quits.
+
+        Args:
+            frameClock: Frame clock of the window
+        """
+        now = time.perf_counter()
+        if self.firstFrame is None:
+            self.firstFrame = now - self.start
+        else:
+            self.frameTimes.append(now - self.frameStart)
+
+        if len(self.frameTimes) < self.frames:
+            self.window.window.queue_draw()
+            return
+
+        renderer = self.window.window.get_renderer()
+        result = {
+            "rendererType": renderer.__gtype__.name if renderer else None,
+            "firstFrame": self.firstFrame,
+            "frameTime": sum(self.frameTimes) / len(self.frameTimes),
+        }
+        print(json.dumps(result), flush=True)
+        self.window.app.quit()
+
+
+def probeChild(frames: int = PROBE_FRAMES) -> None:
+    """
+    Entry point of the probe subprocess.
+
+    Opens the power menu with the renderer given by GSK_RENDERER, measures
+    it with a FrameProbe and exits. The application is not unique, so a
+    resident menu neither swallows the probe nor gets shown by it.
+    Buttons run in dry-run mode, so activating one only ends the probe.
+
+    Args:
+        frames: Number of frames to measure after the first one
+    """
+    start = time.perf_counter()
+    from hyprpwmenu.window import Window
+
+    window = Window(unique=False)
+    # The probe window grabs the keyboard, a stray Enter must not power off
+    window.dryRun = True
+    window.app.connect("activate", FrameProbe(window, start, frames).attach)
+    window.run()
+
+
+def probeRenderer(renderer: str) -> Optional[Dict[str, float]]:
+    """
+    Measure one renderer in a subprocess.
+
+    Args:
+        renderer: Concrete renderer name (cairo, ngl or vulkan)
+
+    Returns:
+        Optional[Dict[str, float]]: "firstFrame" and "frameTime" in seconds, or
+        None if the renderer is unavailable or the probe failed
+    """
+    env = dict(os.environ, GSK_RENDERER=renderer)
+    command = [
+        sys.executable,
+        "-c",
+        "from hyprpwmenu.renderer import probeChild; probeChild()",
+    ]
+    try:
+        output = subprocess.run(
+            command,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            timeout=PROBE_TIMEOUT,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+    except (subprocess.TimeoutExpired, IndexError, ValueError):
+        return None
+
+    # GTK silently falls back to another renderer when the requested one is unusable
+    rendererType = (result.get("rendererType") or "").lower()
+    if RENDERER_TYPE_NAMES[renderer] not in rendererType:
+        return None
+    return {"firstFrame": result["firstFrame"], "frameTime": result["frameTime"]}
+
+
+def probeRenderers(
+    runs: int = PROBE_RUNS,
+) -> Dict[str, Optional[Dict[str, float]]]:
+    """
+    Measure every renderer and store the fastest one.
+
+    Each renderer is first probed once untimed, which warms the page cache
+    and the shader caches and sorts out unavailable renderers. The timed runs
+    are then interleaved, with the order rotated on every round so no
+    renderer always runs first, and the median of each renderer is kept.
+
+    Renderers are ranked by median time-to-first-frame, the latency a user
+    notices when opening the menu. The fastest is written to
+    RENDERER_CACHE_FILE so the "auto" renderer setting picks it up on later
+    launches.
+
+    Args:
+        runs: Number of timed runs of each renderer
+
+    Returns:
+        Dict[str, Optional[Dict[str, float]]]: Median "firstFrame" and
+        "frameTime" of each renderer, None for unavailable renderers
+    """
+    renderers = [r for r in RENDERERS[1:] if probeRenderer(r) is not None]
+    samples: Dict[str, List[Dict[str, float]]] = {r: [] for r in renderers}
+    for run in range(runs):
+        shift = run % len(renderers) if renderers else 0
+        for renderer in renderers[shift:] + renderers[:shift]:
+            result = probeRenderer(renderer)
+            if result is not None:
+                samples[renderer].append(result)
+
+    results: Dict[str, Optional[Dict[str, float]]] = {}
+    for renderer in RENDERERS[1:]:
+        values = samples.get(renderer)
+        results[renderer] = (
+            {
+                key: statistics.median(sample[key] for sample in values)
+                for key in ("firstFrame", "frameTime")
+            }
+            if values
+            else None
+        )
+
+    available = {name: result for name, result in results.items() if result}
+    if available:
+        fastest = min(available, key=lambda name: available[name]["firstFrame"])
+        writeFileAtomic(
+            RENDERER_CACHE_FILE,
+            json.dumps({"renderer": fastest, "results": results}, indent=2),
+        )
+    return results
@@ -0,0 +1,102 @@
+"""
+Usage History Module for HyprPwMenu
+
+This module records how often and how recently each button is activated and
+ranks the buttons with a decaying frequency score. Every activation adds 1 to
+the score of its button, and scores halve every `usage_half_life` days, so the
+score favours buttons that are used both often and recently.
+
+The history is a small JSON file mapping Button.id to its score and the time
+of the last update:
+
+    {"buttonPowerOff": {"score": 3.2, "time": 1760000000.0}}
+
+Functions:
+    loadUsage: Read the usage history
+    usageScores: Current score of every button in the history
+    recordUsage: Record the activation of a button
+"""
+
+import json
+import time
+from typing import Dict, Optional
+from hyprpwmenu.constants import USAGE_HISTORY_FILE
+from hyprpwmenu.util import writeFileAtomic
+
+#: Seconds in one day, the unit of the half-life setting
+SECONDS_PER_DAY = 86400.0
+
+
+def loadUsage(path: str = USAGE_HISTORY_FILE) -> Dict[str, Dict[str, float]]:
+    """
+    Read the usage history.
+
+    Args:
+        path: Path of the usage history file
+
+    Returns:
+        Dict[str, Dict[str, float]]: Score and update time of each Button.id,
+        empty if the file is missing or unreadable
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            history = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return history if isinstance(history, dict) else {}
+
+
+def decayedScore(entry: Dict[str, float], halfLife: float, now: float) -> float:
+    """
+    Score of a history entry decayed up to `now`.
+
+    Args:
+        entry: History entry with "score" and "time"
+        halfLife: Half-life of the score in days
+        now: Current time as returned by time.time()
+
+    Returns:
+        float: The decayed score
+    """
+    age = max(now - entry.get("time", now), 0.0) / SECONDS_PER_DAY
+    return entry.get("score", 0.0) * 0.5 ** (age / halfLife)
+
+
+def usageScores(
+    history: Dict[str, Dict[str, float]], halfLife: float, now: Optional[float] = None
+) -> Dict[str, float]:
+    """
+    Current score of every button in the history.
+
+    Args:
+        history: Usage history as returned by loadUsage
+        halfLife: Half-life of the scores in days
+        now: Current time, defaults to time.time()
+
+    Returns:
+        Dict[str, float]: Score of each Button.id
+    """
+    now = time.time() if now is None else now
+    return {
+        buttonId: decayedScore(entry, halfLife, now)
+        for buttonId, entry in history.items()
+    }
+
+
+def recordUsage(buttonId: str, halfLife: float, path: str = USAGE_HISTORY_FILE) -> None:
+    """
+    Record the activation of a button.
+
+    The history file is replaced atomically, so an activation that powers
+    off the machine can never leave a truncated file behind.
+
+    Args:
+        buttonId: Button.id of the activated button
+        halfLife: Half-life of the scores in days
+        path: Path of the usage history file
+    """
+    now = time.time()
+    history = loadUsage(path)
+    score = decayedScore(history.get(buttonId, {}), halfLife, now) + 1.0
+    history[buttonId] = {"score": score, "time": now}
+    writeFileAtomic(path, json.dumps(history))
@@ -12,9 +12,15 @@ Functions:
     fileExists: Check if a file exists at the given path
     configDirExists: Check if a configuration directory exists
     executeCommand: Execute shell command and return exit code with output
+    writeFileAtomic: Write a file through a temporary file and an atomic rename
+    readAssetFile: Read a file packaged in the assets directory
+    copyAssetFile: Copy a packaged asset into a directory, atomically
+    hyprlandRequest: Send a request to the Hyprland IPC socket
+    focusedMonitorName: Name of the monitor focused in Hyprland
 
 Dependencies:
     - os: File system operations
+    - socket: Hyprland IPC socket requests
     - subprocess: Process execution for shell commands
     - rich.console: Enhanced console output with colors and formatting
 
@@ -22,14 +28,16 @@ Global Variables:
     cl (Console): Rich console instance configured with timestamp logging
 """
 
+import json
 import os
+import socket
 import subprocess
+import tempfile
 from rich.console import Console
 from hyprpwmenu.constants import SPACES_DEFAULT
-from hyprpwmenu.constants import APP_NAME
-from typing import Tuple
+from hyprpwmenu.constants import APP_NAME, HYPRLAND_IPC_TIMEOUT
+from typing import Optional, Tuple, Union
 import importlib.resources
-import shutil
 
 
 #: Rich console instance for enhanced output with timestamp logging
@@ -184,9 +192,122 @@ def executeCommand(command: str) -> Tuple[int, str, str]:
     return process.returncode, stdout, stderr
 
 
+def writeFileAtomic(path: str, content: Union[str, bytes]) -> None:
+    """
+    Write a file through a temporary file and an atomic rename.
+
+    Readers see either the previous or the new content, never a partial file.
+
+    Args:
+        path: Destination file, its directory is created if needed
+        content: Text or bytes to write
+
+    Example:
+        >>> writeFileAtomic("/home/user/.cache/hyprpwmenu/usage.json", "{}")
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmpPath = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+    try:
+        mode, encoding = ("wb", None) if isinstance(content, bytes) else ("w", "utf-8")
+        with os.fdopen(fd, mode, encoding=encoding) as f:
+            os.fchmod(f.fileno(), 0o644)  # mkstemp creates files as 0600
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmpPath, path)
+    except BaseException:
+        os.unlink(tmpPath)
+        raise
+
+
+def readAssetFile(asset: str) -> bytes:
+    """
+    Read a file packaged in the assets directory.
+
+    Args:
+        asset: File name inside the assets directory
+
+    Returns:
+        bytes: Content of the asset
+
+    Example:
+        >>> readAssetFile("style.css")[:6]
+        b'window'
+    """
+    return importlib.resources.files(APP_NAME).joinpath(f"assets/{asset}").read_bytes()
+
+
 def copyAssetFile(destination: str, asset: str) -> None:
+    """
+    Copy a packaged asset into a directory, atomically.
+
+    Args:
+        destination: Directory receiving the asset, created if needed
+        asset: File name inside the assets directory
+    """
     destination = os.path.expanduser(destination)
-    if not os.path.exists(destination):
-        os.makedirs(destination)
-    source = importlib.resources.files(APP_NAME).joinpath(f"assets/{asset}")
-    shutil.copy2(str(source), destination)
+    writeFileAtomic(os.path.join(destination, asset), readAssetFile(asset))
+
+
+def hyprlandRequest(request: str) -> Optional[str]:
+    """
+    Send a request to the Hyprland IPC socket and return the reply.
+
+    Talks to the socket directly instead of spawning `hyprctl`.
+
+    Args:
+        request: Hyprland IPC request, e.g. "j/monitors"
+
+    Returns:
+        Optional[str]: The reply, or None if Hyprland is not reachable
+
+    Example:
+        >>> hyprlandRequest("j/activeworkspace")
+        '{"id": 1, "name": "1", "monitor": "DP-1", ...}'
+    """
+    signature = os.environ.get("HYPRLAND_INSTANCE_SIGNATURE")
+    if not signature:
+        return None
+
+    # Hyprland >= 0.40 uses $XDG_RUNTIME_DIR/hypr, older releases /tmp/hypr
+    for base in (os.environ.get("XDG_RUNTIME_DIR", ""), "/tmp"):
+        path = os.path.join(base, "hypr", signature, ".socket.sock")
+        if not os.path.exists(path):
+            continue
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(HYPRLAND_IPC_TIMEOUT)
+                sock.connect(path)
+                sock.sendall(request.encode())
+                chunks = []
+                while chunk := sock.recv(8192):
+                    chunks.append(chunk)
+        except OSError:
+            return None
+        return b"".join(chunks).decode()
+    return None
+
+
+def focusedMonitorName() -> Optional[str]:
+    """
+    Name of the monitor focused in Hyprland.
+
+    Returns:
+        Optional[str]: Connector name such as "DP-1", or None if unknown
+
+    Example:
+        >>> focusedMonitorName()
+        'DP-1'
+    """
+    reply = hyprlandRequest("j/monitors")
+    if reply is None:
+        return None
+    try:
+        monitors = json.loads(reply)
+    except ValueError:
+        return None
+    for monitor in monitors:
+        if monitor.get("focused"):
+            return monitor.get("name")
+    return None
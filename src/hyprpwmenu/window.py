@@ -6,6 +6,10 @@ It uses GTK4 Layer Shell to create an overlay window with power menu buttons and
 handles user interactions through keyboard and mouse events.
 
 Classes:
+    MenuWindow: Window built from the menu_window.ui template
+    MenuPage: Menu level built from the menu_page.ui template
+    MenuButton: Button built from the menu_button.ui template
+    MenuSurface: Layer shell window of one monitor with its widgets
     Window: Main application window class managing the GUI interface
 
 Dependencies:
@@ -16,19 +20,33 @@ Dependencies:
 
 Features:
     - Overlay window using GTK4 Layer Shell
+    - Opens on the monitor focused in Hyprland, optionally from a window pool
+    - Initial focus and button order ranked by usage history
     - Keyboard navigation with arrow keys and ESC/Q for exit
+    - Nested sub-menus as lazily built pages of a Gtk.Stack, Backspace/ESC go up
     - Mouse hover effects and click handling
-    - Dynamic button creation from configuration
+    - Widget tree declared in Gtk.Template UI definitions, bound to the configuration
     - CSS styling support
     - System command execution for power operations
+    - Parallel pre-hook pipeline run before the command, with progress in the hint label
 """
 
 from ctypes import CDLL
 import os
+import threading
+import time
 from hyprpwmenu.constants import APP_NAME, DEFAULT_STYLE_FILE
-from hyprpwmenu.util import printLog, executeCommand
-from hyprpwmenu.config import AppConfig
-from typing import List
+from hyprpwmenu.util import printLog, executeCommand, focusedMonitorName, readAssetFile
+from hyprpwmenu.config import AppConfig, Button
+from hyprpwmenu.usage import loadUsage, recordUsage, usageScores
+from hyprpwmenu.hooks import (
+    HookCancel,
+    HookResult,
+    hookSummary,
+    hooksSucceeded,
+    runHooks,
+)
+from typing import Callable, Dict, List, NamedTuple, Optional
 
 CDLL("libgtk4-layer-shell.so")
 
@@ -38,7 +56,70 @@ gi.require_version("Gtk", "4.0")
 gi.require_version("Gdk", "4.0")
 gi.require_version("Gtk4LayerShell", "1.0")
 
-from gi.repository import Gtk, Gdk, Gtk4LayerShell  # pyright: ignore # noqa
+from gi.repository import Gtk, Gdk, Gio, GLib, Gtk4LayerShell  # pyright: ignore # noqa
+
+
+@Gtk.Template(string=readAssetFile("menu_window.ui").decode())
+class MenuWindow(Gtk.ApplicationWindow):
+    """
+    Power menu window built from the menu_window.ui template.
+
+    GTK parses the template once per class and reuses it for every
+    instance, so building a window costs a single instantiation.
+
+    Attributes:
+        key_controller (Gtk.EventControllerKey): Keyboard controller of the window
+        page_stack (Gtk.Stack): One MenuPage per visited menu level
+        hint_label (Gtk.Label): Label displaying button hints
+    """
+
+    __gtype_name__ = "HyprPwMenuWindow"
+
+    key_controller = Gtk.Template.Child()
+    page_stack = Gtk.Template.Child()
+    hint_label = Gtk.Template.Child()
+
+
+@Gtk.Template(string=readAssetFile("menu_page.ui").decode())
+class MenuPage(Gtk.Box):
+    """
+    Row of power menu buttons of one menu level, built from menu_page.ui.
+    """
+
+    __gtype_name__ = "HyprPwMenuPage"
+
+
+@Gtk.Template(string=readAssetFile("menu_button.ui").decode())
+class MenuButton(Gtk.Button):
+    """
+    Power menu button built from the menu_button.ui template.
+
+    Attributes:
+        image (Gtk.Image): Icon of the button
+        motion_controller (Gtk.EventControllerMotion): Hover controller
+    """
+
+    __gtype_name__ = "HyprPwMenuButton"
+
+    image = Gtk.Template.Child()
+    motion_controller = Gtk.Template.Child()
+
+
+class MenuSurface(NamedTuple):
+    """
+    Layer shell window of one monitor with its widgets.
+
+    Attributes:
+        window (Gtk.ApplicationWindow): The layer shell window
+        pageStack (Gtk.Stack): Stack holding one page per visited menu level
+        hintLabel (Gtk.Label): Label displaying button hints of the window
+        pages (Dict[str, List[Gtk.Button]]): Buttons of each built page, by page name
+    """
+
+    window: Gtk.ApplicationWindow
+    pageStack: Gtk.Stack
+    hintLabel: Gtk.Label
+    pages: Dict[str, List[Gtk.Button]]
 
 
 class Window:
@@ -50,19 +131,61 @@ class Window:
     to create an overlay window that stays above other applications.
 
     Attributes:
-        buttons (List[Gtk.Button]): List of power menu buttons
+        buttons (List[Gtk.Button]): Power menu buttons of the visible page
         currentFocusIndex (int): Index of currently focused button
         app (Gtk.Application): GTK4 application instance
         appConfig (AppConfig): Application configuration loaded from YAML
+        rootEntries (List[Button]): Top level buttons in display order
+        initialFocusIndex (int): Index of the top level button focused on opening
+        entries (List[Button]): Buttons of the visible menu level
+        menuPath (List[Button]): Buttons whose sub-menus lead to the visible level
+        focusStack (List[int]): Focus index of each level in menuPath
+        surface (MenuSurface): The active window with its widgets
+        window (Gtk.ApplicationWindow): Layer shell window, created on activation
         hintLabel (Gtk.Label): Label displaying button hints/tooltips
+        pooled (bool): `monitor_pool` is enabled and the application is unique
+        windowPool (Dict[Gdk.Monitor, MenuSurface]): Pre-built window of each
+            monitor when pooled
+        textures (Dict[str, Gdk.Texture]): Icons decoded once and shared by all
+            windows, sub-menu icons are decoded while idle after the first frame
+        dryRun (bool): Log the command of an activated button and quit instead
+            of running it, used by profiled runs
+        hooksRunning (bool): Pre-hooks of a button are running, further
+            activations are ignored and the hint label shows their progress
+        hookCancel (Optional[HookCancel]): Cancellation handle of the running
+            pre-hooks, used when the menu is closed
+        firstFrameCallbacks (List[Callable[[], None]]): Called once after the
+            first frame of the menu was painted
 
     Methods:
         __init__: Initialize the window and GTK application
+        rankEntries: Order buttons and pick the initial focus from usage history
         on_activate: Callback for GTK application activation
+        buildWindow: Create a layer shell window with its widgets
+        buildPage: Create the page of a menu level
+        activateSurface: Make a window the target of input handlers
+        pageName: Stack page name of the visible menu level
+        showPage: Show the page of the visible menu level
+        enterGroup: Open the sub-menu of a button
+        leaveGroup: Go up one menu level
+        focusedMonitor: Find the Gdk.Monitor focused in Hyprland
+        syncWindowPool: Build or drop pooled windows to match the monitors
+        onMonitorsChanged: Handle monitors being added or removed
+        showOnFocusedMonitor: Show the pooled window of the focused monitor
+        watchFirstFrame: Run firstFrameCallbacks after the first painted frame
+        loadCss: Load the CSS style file for the display
+        closeMenu: Hide the resident menu or quit the application
         on_key_pressed: Handle keyboard input events
         onMouseEnter: Handle mouse enter events on buttons
         onMouseLeave: Handle mouse leave events on buttons
         onMouseClick: Handle button click events
+        runPreHooks: Run the pre-hooks of a button in a worker thread
+        onHookProgress: Show pre-hook progress in the hint label
+        onHooksDone: Run the button command once its pre-hooks finished
+        cancelHooks: Kill the running pre-hooks so their command never runs
+        runEntry: Run the command of a button
+        loadTexture: Decode an icon once and cache it
+        preloadTextures: Decode sub-menu icons while idle
         makeButton: Create a button from configuration
         updateHintLabel: Update the hint label text
         onWindowRealize: Handle window realization event
@@ -73,13 +196,21 @@ class Window:
     buttons: List[Gtk.Button]
     currentFocusIndex = 0
 
-    def __init__(self) -> None:
+    def __init__(self, unique: bool = True) -> None:
         """
         Initialize the Window instance and GTK application.
 
         Creates the GTK application, loads configuration, and initializes
         the button list. Sets up the application ID and connects activation callback.
 
+        A unique application forwards later launches to a running instance,
+        which is what keeps the window pool resident. Probe, profile and
+        benchmark runs must measure their own process, so they pass
+        unique=False and never use the window pool.
+
+        Args:
+            unique: Register the application ID on the session bus
+
         Side Effects:
             - Creates GTK application instance
             - Loads AppConfig from YAML file
@@ -88,12 +219,59 @@ class Window:
         """
         # Create the GTK application
         printLog("Initializing GTK application...")
-        self.app = Gtk.Application(application_id=f"com.antrax.{APP_NAME}")
+        flags = (
+            Gio.ApplicationFlags.FLAGS_NONE
+            if unique
+            else Gio.ApplicationFlags.NON_UNIQUE
+        )
+        self.app = Gtk.Application(application_id=f"com.antrax.{APP_NAME}", flags=flags)
         self.app.connect("activate", self.on_activate)
         self.appConfig = AppConfig()
+        self.pooled = self.appConfig.monitor_pool and unique
+        self.rootEntries = self.rankEntries()
+        self.initialFocusIndex = self.currentFocusIndex
+        self.entries = self.rootEntries
+        self.menuPath: List[Button] = []
+        self.focusStack: List[int] = []
 
         printLog("Initializing button list...")
         self.buttons = []
+        self.windowPool: Dict[Gdk.Monitor, MenuSurface] = {}
+        self.textures: Dict[str, Gdk.Texture] = {}
+        self.dryRun = False
+        self.hooksRunning = False
+        self.hookCancel: Optional[HookCancel] = None
+        self.firstFrameCallbacks: List[Callable[[], None]] = []
+        if any(entry.children for entry in self.rootEntries):
+            self.firstFrameCallbacks.append(self.preloadTextures)
+
+    def rankEntries(self) -> List[Button]:
+        """
+        Order top level buttons and pick the initial focus from the usage history.
+
+        Scores are computed once here, so opening the menu costs nothing more.
+        Without `usage_history` the configuration order and the first button
+        are kept.
+
+        Returns:
+            List[Button]: Configured buttons in display order
+
+        Side Effects:
+            - Sets currentFocusIndex to the button with the best score
+        """
+        entries = list(self.appConfig.buttons)
+        if not self.appConfig.usage_history:
+            return entries
+
+        printLog("Ranking buttons by usage...")
+        scores = usageScores(loadUsage(), self.appConfig.usage_half_life)
+        if self.appConfig.usage_order:
+            # sort is stable, unused buttons keep their configuration order
+            entries.sort(key=lambda b: scores.get(b.id, 0.0), reverse=True)
+        self.currentFocusIndex = max(
+            range(len(entries)), key=lambda i: scores.get(entries[i].id, 0.0)
+        )
+        return entries
 
     def on_key_pressed(self, controller, keyval, keycode, state) -> bool:
         """
@@ -114,17 +292,24 @@ class Window:
         Key Mappings:
             - Right Arrow: Move focus to next button (wraps around)
             - Left Arrow: Move focus to previous button (wraps around)
-            - Q/Escape: Quit the application
+            - Backspace: Go up one menu level
+            - Escape: Go up one menu level, quit at the top level
+            - Q: Quit the application
         """
         printLog(f"Key pressed: keyval={keyval}, keycode={keycode}")
 
         if keyval == Gdk.KEY_q:
             printLog("Key 'q' pressed - Exiting...")
-            self.app.quit()
+            self.closeMenu()
             return True
         elif keyval == Gdk.KEY_Escape:
+            if self.leaveGroup():
+                return True
             printLog("ESC key pressed - Exiting...")
-            self.app.quit()
+            self.closeMenu()
+            return True
+        elif keyval == Gdk.KEY_BackSpace:
+            self.leaveGroup()
             return True
 
         elif keyval == Gdk.KEY_Right:
@@ -200,12 +385,15 @@ class Window:
         Update the hint label text based on current button focus.
 
         Retrieves the hint text from the currently focused button's configuration
-        and updates the hint label display.
+        and updates the hint label display. While pre-hooks run the label keeps
+        their progress.
 
         Side Effects:
             - Updates hintLabel text content
         """
-        self.hintLabel.set_label(self.appConfig.buttons[self.currentFocusIndex].hint)
+        if self.hooksRunning:
+            return
+        self.hintLabel.set_label(self.entries[self.currentFocusIndex].hint)
 
     def onMouseLeave(
         self, controller: Gtk.EventControllerMotion, button: Gtk.Button
@@ -227,73 +415,257 @@ class Window:
         Handle button click events and execute associated commands.
 
         Executes the system command associated with the currently focused button
-        as defined in the application configuration.
+        as defined in the application configuration. A button with children
+        opens its sub-menu instead. When the button has pre-hooks, they run
+        first in a worker thread and the command follows from onHooksDone.
 
         Args:
             button: The button that was clicked
 
         Side Effects:
-            - Executes system command via executeCommand utility
+            - Starts the pre-hook pipeline or runs the command
             - Logs button click event
         """
         printLog(f"Mouse clicked button: {button.get_name()}")
-        executeCommand(self.appConfig.buttons[self.currentFocusIndex].command)
+        if self.hooksRunning:
+            printLog("Pre-hooks still running, ignoring click")
+            return
+
+        entry = self.entries[self.currentFocusIndex]
+        if entry.children:
+            self.enterGroup(entry)
+            return
+
+        if self.dryRun:
+            printLog(f"Dry run, not running: {entry.command}")
+            self.app.quit()
+            return
+
+        if not entry.pre_hooks:
+            self.runEntry(entry, [])
+            return
+
+        self.hooksRunning = True
+        self.hookCancel = HookCancel()
+        threading.Thread(
+            target=self.runPreHooks, args=(entry, self.hookCancel), daemon=True
+        ).start()
+
+    def runPreHooks(self, entry: Button, cancel: HookCancel) -> None:
+        """
+        Run the pre-hooks of a button. Called in a worker thread.
+
+        Progress and completion are handed back to the GTK main loop with
+        GLib.idle_add, widgets are never touched from this thread.
+
+        Args:
+            entry: The activated button
+            cancel: Cancellation handle of this run
+        """
+        try:
+            results = runHooks(
+                entry.pre_hooks,
+                self.appConfig.hook_concurrency,
+                entry.hook_policy,
+                lambda running, finished, total: GLib.idle_add(
+                    self.onHookProgress, running, finished, total, cancel
+                ),
+                cancel,
+            )
+        except Exception as e:
+            # onHooksDone must always run, or every later click is ignored
+            printLog(f"Pre-hook pipeline failed: {e}")
+            results = [HookResult(hook.name, "failed") for hook in entry.pre_hooks]
+        GLib.idle_add(self.onHooksDone, entry, results, cancel)
+
+    def onHookProgress(
+        self, running: List[str], finished: int, total: int, cancel: HookCancel
+    ) -> bool:
+        """
+        Show pre-hook progress in the hint label.
+
+        Args:
+            running: Names of the hooks currently running
+            finished: Number of finished hooks
+            total: Number of hooks
+            cancel: Cancellation handle of the run, progress of a cancelled
+                run is dropped
+
+        Returns:
+            bool: False to run only once as an idle callback
+        """
+        if not cancel.cancelled:
+            self.hintLabel.set_label(f"[{finished}/{total}] {', '.join(running)}")
+        return False
+
+    def onHooksDone(
+        self, entry: Button, results: List[HookResult], cancel: HookCancel
+    ) -> bool:
+        """
+        Run the button command once its pre-hooks finished.
+
+        With the "closed" policy a failed hook cancels the command and the
+        failure is shown in the hint label. A cancelled run never runs the
+        command, whatever the policy.
+
+        Args:
+            entry: The activated button
+            results: Results of the pre-hooks
+            cancel: Cancellation handle of the run
+
+        Returns:
+            bool: False to run only once as an idle callback
+        """
+        if cancel.cancelled:
+            # cancelHooks already reset the state, a new run may be going on
+            printLog(f"Pre-hooks cancelled, not running: {entry.command}")
+            return False
+
+        self.hooksRunning = False
+        self.hookCancel = None
+        if not hooksSucceeded(results, entry.hook_policy):
+            failed = [result.name for result in results if result.status != "ok"]
+            printLog(f"Pre-hooks failed, not running: {entry.command}")
+            for line in hookSummary(results):
+                printLog(line)
+            self.hintLabel.set_label(f"Failed: {', '.join(failed)}")
+            return False
+
+        self.runEntry(entry, results)
+        return False
+
+    def runEntry(self, entry: Button, results: List[HookResult]) -> None:
+        """
+        Run the command of a button.
+
+        Args:
+            entry: The activated button
+            results: Results of its pre-hooks, logged as a timing summary
+
+        Side Effects:
+            - Records the activation in the usage history if enabled, a
+              failed write is only logged
+            - Executes system command via executeCommand utility
+        """
+        if results:
+            printLog(f"Pre-hooks done, running: {entry.command}")
+            for line in hookSummary(results):
+                printLog(line)
+
+        # Recorded first, executeCommand waits for commands such as poweroff
+        # that may never return. The history only ranks buttons, so a failed
+        # write must not keep the command from running.
+        if self.appConfig.usage_history:
+            try:
+                recordUsage(entry.id, self.appConfig.usage_half_life)
+            except OSError as e:
+                printLog(f"Could not record usage of '{entry.id}': {e}")
+        executeCommand(entry.command)
+
+        # A resident menu must not stay open once its action ran
+        if self.pooled:
+            self.window.set_visible(False)
 
     def on_activate(self, app) -> None:
         """
         Callback function executed when the GTK application is activated.
 
         This function is the main initialization point for the GUI interface.
-        It creates and configures the main window, sets up GTK4 Layer Shell,
-        creates buttons from configuration, and handles window styling.
+        It loads the CSS styling and shows the menu on the focused monitor,
+        either from a freshly built window or from the window pool.
+
+        When `monitor_pool` is enabled the application stays resident, so a
+        later launch activates it again and only shows the pooled window of
+        the focused monitor.
 
         Args:
             app: The GTK4 application instance
 
         Side Effects:
-            - Creates main application window
-            - Initializes GTK4 Layer Shell with overlay layer
-            - Creates button interface from configuration
+            - Creates the main application window or the window pool
             - Loads CSS styling
-            - Sets up keyboard and mouse event handlers
             - Displays the window on screen
         """
-        # Create the main window
-        printLog("Creating main window...")
-        window = Gtk.ApplicationWindow(application=app)
-        window.set_title(f"{APP_NAME}")
+        if self.windowPool:
+            printLog("Reusing window pool...")
+            self.showOnFocusedMonitor()
+            return
 
-        # Initialize GTK4 Layer Shell for the window
-        printLog("Initializing GTK4 Layer Shell...")
-        Gtk4LayerShell.init_for_window(window)
+        display = Gdk.Display.get_default()
+        self.loadCss(display)
+
+        if self.pooled:
+            printLog("Building window pool...")
+            app.hold()
+            display.get_monitors().connect("items-changed", self.onMonitorsChanged)
+            self.syncWindowPool()
+            self.showOnFocusedMonitor()
+            self.watchFirstFrame()
+            return
+
+        self.activateSurface(self.buildWindow(app, self.focusedMonitor()))
 
-        printLog("Creating main box...")
-        mainBox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+        # Show the window and grab focus
+        self.window.present()
+        self.watchFirstFrame()
 
-        printLog("Creating top and bottom boxes...")
-        topBox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
-        bottomBox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
-        mainBox.append(topBox)
-        mainBox.append(bottomBox)
+    def watchFirstFrame(self) -> None:
+        """
+        Run firstFrameCallbacks once the first frame of the window was painted.
+        """
+        if not self.firstFrameCallbacks:
+            return
 
-        printLog("Configuring main boxes alignment...")
-        mainBox.set_halign(Gtk.Align.CENTER)
-        mainBox.set_valign(Gtk.Align.CENTER)
-        topBox.set_halign(Gtk.Align.CENTER)
-        topBox.set_valign(Gtk.Align.CENTER)
-        bottomBox.set_halign(Gtk.Align.CENTER)
-        bottomBox.set_valign(Gtk.Align.CENTER)
+        def onAfterPaint(frameClock) -> None:
+            frameClock.disconnect(handlerId)
+            for callback in self.firstFrameCallbacks:
+                callback()
 
-        printLog("Adding main box to the window...")
-        window.set_child(mainBox)
+        def onTick(widget, frameClock) -> bool:
+            nonlocal handlerId
+            handlerId = frameClock.connect("after-paint", onAfterPaint)
+            return False
 
-        printLog("Adding buttons to the main box...")
-        for b in self.appConfig.buttons:
-            topBox.append(self.makeButton(icon_path=b.icon_path, id=b.id))
+        handlerId = 0
+        self.window.add_tick_callback(onTick)
 
-        self.hintLabel = Gtk.Label(label=self.appConfig.buttons[0].hint)
-        self.hintLabel.set_name("hint_label")
-        bottomBox.append(self.hintLabel)
+    def buildWindow(self, app, monitor: Optional[Gdk.Monitor]) -> MenuSurface:
+        """
+        Create a layer shell window with its widgets.
+
+        The widget tree comes from the MenuWindow and MenuButton templates,
+        this method only initializes GTK4 Layer Shell, binds the configuration
+        and connects event handlers. The window is not shown.
+
+        Args:
+            app: The GTK4 application instance
+            monitor: Monitor to place the window on, None lets the compositor choose
+
+        Returns:
+            MenuSurface: The window with its buttons and hint label
+        """
+        # Create the main window from the menu_window.ui template
+        printLog("Creating main window...")
+        window = MenuWindow(application=app)
+        window.set_title(f"{APP_NAME}")
+
+        # Initialize GTK4 Layer Shell for the window
+        printLog("Initializing GTK4 Layer Shell...")
+        Gtk4LayerShell.init_for_window(window)
+        if monitor is not None:
+            printLog(f"Placing window on monitor {monitor.get_connector()}...")
+            Gtk4LayerShell.set_monitor(window, monitor)
+
+        surface = MenuSurface(
+            window=window,
+            pageStack=window.page_stack,
+            hintLabel=window.hint_label,
+            pages={},
+        )
+
+        # Sub-menu pages are built on their first visit
+        printLog("Adding top level page...")
+        self.buildPage(surface, "root", self.rootEntries)
 
         # Configure the layer (overlay layer to stay above other windows)
         printLog("Configuring layer...")
@@ -310,30 +682,247 @@ class Window:
         Gtk4LayerShell.set_anchor(window, Gtk4LayerShell.Edge.LEFT, False)
         Gtk4LayerShell.set_anchor(window, Gtk4LayerShell.Edge.RIGHT, False)
 
-        # Create and configure the key event controller
+        # Bind the key event controller of the template
         printLog("Setting up key event controller...")
-        key_controller = Gtk.EventControllerKey()
-        key_controller.connect("key-pressed", self.on_key_pressed)
-        window.add_controller(key_controller)
+        window.key_controller.connect("key-pressed", self.on_key_pressed)
+
+        # Connect close event
+        window.connect("close-request", self.on_close)
+
+        # Connect to the "realize" signal of the window
+        # This ensures the window and its children are fully drawn before we try to set focus
+        window.connect("realize", self.onWindowRealize)
+
+        return surface
+
+    def buildPage(
+        self, surface: MenuSurface, name: str, entries: List[Button]
+    ) -> List[Gtk.Button]:
+        """
+        Create the page of a menu level and add it to the window stack.
+
+        Args:
+            surface: The window receiving the page
+            name: Stack page name, as returned by pageName
+            entries: Buttons of the menu level
+
+        Returns:
+            List[Gtk.Button]: Buttons of the page
+        """
+        page = MenuPage()
+        buttons = []
+        for b in entries:
+            button = self.makeButton(icon_path=b.icon_path, id=b.id, hint=b.hint)
+            buttons.append(button)
+            page.append(button)
+
+        surface.pageStack.add_named(page, name)
+        surface.pages[name] = buttons
+        return buttons
+
+    def activateSurface(self, surface: MenuSurface) -> None:
+        """
+        Make a window the target of keyboard, mouse and hint label handling.
+
+        Args:
+            surface: The window with its widgets
+        """
+        self.surface = surface
+        self.window = surface.window
+        self.hintLabel = surface.hintLabel
+        self.showPage()
+
+    def pageName(self) -> str:
+        """
+        Stack page name of the visible menu level.
+
+        Pages are keyed by position, button ids are not required to be unique.
+
+        Returns:
+            str: "root", followed by the index of each button of menuPath
+            within its level, as kept in focusStack
+        """
+        return "/".join(["root", *(str(index) for index in self.focusStack)])
+
+    def showPage(self) -> None:
+        """
+        Show the page of the visible menu level on the active window.
+
+        The page is built on its first visit and kept in the stack, so later
+        visits only change the visible child. Its icons were normally decoded
+        by preloadTextures already. `benchmarks/bench_pages.py` measures both.
+
+        Side Effects:
+            - Updates buttons and the hint label
+        """
+        start = time.perf_counter()
+        name = self.pageName()
+        buttons = self.surface.pages.get(name)
+        if buttons is None:
+            printLog(f"Building page {name}...")
+            buttons = self.buildPage(self.surface, name, self.entries)
+
+        self.surface.pageStack.set_visible_child_name(name)
+        self.buttons = buttons
+        self.updateHintLabel()
+        printLog(f"Page {name} shown in {(time.perf_counter() - start) * 1000:.2f} ms")
+
+    def enterGroup(self, entry: Button) -> None:
+        """
+        Open the sub-menu of a button.
+
+        Args:
+            entry: Button with children
+        """
+        printLog(f"Entering sub-menu {entry.id}")
+        # The position of the group names the page, see pageName
+        self.currentFocusIndex = next(
+            i for i, candidate in enumerate(self.entries) if candidate is entry
+        )
+        self.focusStack.append(self.currentFocusIndex)
+        self.menuPath.append(entry)
+        self.entries = entry.children
+        self.currentFocusIndex = 0
+        self.showPage()
+        self.buttons[self.currentFocusIndex].grab_focus()
+
+    def leaveGroup(self) -> bool:
+        """
+        Go up one menu level, restoring the focus of that level.
+
+        Returns:
+            bool: False if the top level is already visible
+        """
+        if not self.menuPath:
+            return False
+
+        printLog(f"Leaving sub-menu {self.menuPath.pop().id}")
+        self.entries = self.menuPath[-1].children if self.menuPath else self.rootEntries
+        self.currentFocusIndex = self.focusStack.pop()
+        self.showPage()
+        self.buttons[self.currentFocusIndex].grab_focus()
+        return True
+
+    def focusedMonitor(self) -> Optional[Gdk.Monitor]:
+        """
+        Find the Gdk.Monitor focused in Hyprland.
 
+        The focused monitor is queried through the Hyprland IPC socket and
+        matched against the connector name of each Gdk.Monitor.
+
+        Returns:
+            Optional[Gdk.Monitor]: The focused monitor, or None if unknown
+        """
+        name = focusedMonitorName()
+        if name is None:
+            printLog("Focused monitor unknown, letting the compositor choose")
+            return None
+
+        monitors = Gdk.Display.get_default().get_monitors()
+        for i in range(monitors.get_n_items()):
+            monitor = monitors.get_item(i)
+            if monitor.get_connector() == name:
+                return monitor
+        return None
+
+    def syncWindowPool(self) -> None:
+        """
+        Build or drop pooled windows so there is exactly one per monitor.
+
+        Windows of existing monitors are kept untouched, so their widgets,
+        icons and styling are never rebuilt.
+        """
+        monitors = Gdk.Display.get_default().get_monitors()
+        current = [monitors.get_item(i) for i in range(monitors.get_n_items())]
+
+        for monitor in list(self.windowPool):
+            if monitor not in current:
+                printLog(f"Monitor removed: {monitor.get_connector()}")
+                self.windowPool.pop(monitor).window.destroy()
+
+        for monitor in current:
+            if monitor not in self.windowPool:
+                printLog(f"Monitor added: {monitor.get_connector()}")
+                self.windowPool[monitor] = self.buildWindow(self.app, monitor)
+
+    def onMonitorsChanged(self, monitors, position, removed, added) -> None:
+        """
+        Handle monitors being added or removed.
+
+        Args:
+            monitors: Gio.ListModel of the display monitors
+            position: Position of the change
+            removed: Number of monitors removed
+            added: Number of monitors added
+        """
+        self.syncWindowPool()
+
+    def showOnFocusedMonitor(self) -> None:
+        """
+        Show the pooled window of the focused monitor and hide the others.
+
+        Falls back to the first pooled window if the focused monitor is unknown.
+        """
+        if not self.windowPool:
+            printLog("Warning: No monitor available")
+            return
+
+        monitor = self.focusedMonitor()
+        surface = self.windowPool.get(monitor) or next(iter(self.windowPool.values()))
+        for other in self.windowPool.values():
+            if other is not surface:
+                other.window.set_visible(False)
+
+        # The menu reopens at the top level
+        self.menuPath.clear()
+        self.focusStack.clear()
+        self.entries = self.rootEntries
+        self.currentFocusIndex = self.initialFocusIndex
+
+        self.activateSurface(surface)
+        self.window.present()
+        self.buttons[self.currentFocusIndex].grab_focus()
+
+    def loadCss(self, display: Gdk.Display) -> None:
+        """
+        Load the CSS style file for the display.
+
+        Args:
+            display: The display all windows are shown on
+        """
         # Add CSS style for better appearance
         css_provider = Gtk.CssProvider()
         css_provider.load_from_path(f"{DEFAULT_STYLE_FILE}")
-        display = window.get_display()
         Gtk.StyleContext.add_provider_for_display(
             display, css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
         )
         printLog("CSS provider loaded")
 
-        # Connect close event
-        window.connect("close-request", self.on_close)
+    def cancelHooks(self) -> None:
+        """
+        Kill the running pre-hooks so their command never runs.
 
-        # Connect to the "realize" signal of the window
-        # This ensures the window and its children are fully drawn before we try to set focus
-        window.connect("realize", self.onWindowRealize)
+        Called when the menu is closed: a hidden pooled window must not run
+        the command later, and quitting would orphan the hook process groups.
+        """
+        if self.hookCancel is None:
+            return
+        printLog("Menu closed, cancelling pre-hooks...")
+        self.hookCancel.cancel()
+        self.hookCancel = None
+        self.hooksRunning = False
+
+    def closeMenu(self) -> None:
+        """
+        Hide the menu when it is resident, quit the application otherwise.
 
-        # Show the window and grab focus
-        window.present()
+        Running pre-hooks are cancelled first.
+        """
+        self.cancelHooks()
+        if self.pooled:
+            self.window.set_visible(False)
+        else:
+            self.app.quit()
 
     def onWindowRealize(self, window) -> None:
         """
@@ -353,57 +942,97 @@ class Window:
         printLog("Requesting focus for the first button...")
         self.buttons[self.currentFocusIndex].grab_focus()
 
-    def makeButton(self, icon_path: str, id: str) -> Gtk.Button:
+    def loadTexture(self, icon_path: str) -> Gdk.Texture:
+        """
+        Decode an icon once and cache it.
+
+        Textures are shared by the windows of all monitors and all pages.
+
+        Args:
+            icon_path: Path to the PNG icon file
+
+        Returns:
+            Gdk.Texture: The decoded icon
+
+        Raises:
+            GLib.Error: If the icon cannot be read or decoded
+        """
+        texture = self.textures.get(icon_path)
+        if texture is None:
+            texture = Gdk.Texture.new_from_filename(os.path.expanduser(icon_path))
+            self.textures[icon_path] = texture
+        return texture
+
+    def preloadTextures(self) -> None:
+        """
+        Decode the icons of all sub-menus while the main loop is idle.
+
+        Called after the first frame, so the first visit of a sub-menu only
+        instantiates templates. One icon is decoded per idle callback, which
+        keeps frames and input handled in between.
+        """
+        pending: List[str] = []
+        stack = [entry for entry in self.rootEntries if entry.children]
+        while stack:
+            entry = stack.pop()
+            for child in entry.children:
+                if child.icon_path not in self.textures:
+                    pending.append(child.icon_path)
+                if child.children:
+                    stack.append(child)
+
+        def decodeNext() -> bool:
+            if not pending:
+                return False
+            iconPath = pending.pop()
+            try:
+                self.loadTexture(iconPath)
+            except Exception as e:
+                # makeButton logs the error and falls back when the page is built
+                printLog(f"Could not preload icon '{iconPath}': {e}")
+            return bool(pending)
+
+        printLog(f"Preloading {len(pending)} sub-menu icons...")
+        GLib.idle_add(decodeNext)
+
+    def makeButton(self, icon_path: str, id: str, hint: str) -> Gtk.Button:
         """
         Create a GTK button from configuration parameters.
 
-        This method creates a button with an icon image, sets up event controllers
-        for mouse interactions, and configures the button properties according
-        to the application configuration.
+        This method instantiates the MenuButton template, sets its icon and
+        binds the motion and click handlers of the template controllers.
 
         Args:
             icon_path: Absolute path to the PNG icon file
             id: CSS identifier for styling the button
+            hint: Tooltip text of the button
 
         Returns:
             Gtk.Button: Configured button ready for display
 
         Side Effects:
-            - Creates GTK Image from file
-            - Adds button to internal buttons list
-            - Sets up motion event controllers
-            - Connects click event handler
+            - Sets the button image from a cached texture
+            - Connects motion and click event handlers
             - Sets tooltip text
         """
+        button = MenuButton()
+
         # Try to create image from PNG file, fallback if not found
         try:
-            image = Gtk.Image.new_from_file(os.path.expanduser(icon_path))
+            button.image.set_from_paintable(self.loadTexture(icon_path))
         except Exception as e:
             printLog(f"Error loading icon '{icon_path}': {e}")
             # Fallback: use a default GTK icon or a label
-            image = Gtk.Image.new_from_icon_name("image-missing")
-
-        # Create the button
-        button = Gtk.Button.new()
-        button.set_child(image)  # Set the configured label as the button's child
-        button.set_name(
-            id
-        )  # Use set_name for the widget ID, not set_id (deprecated/internal)
-
-        # Add motion controller for hover effects
-        motionController = Gtk.EventControllerMotion()
-        motionController.connect(
-            "enter",
-            lambda controller, x, y: self.onMouseEnter(controller, x, y, button),
-        )
-        motionController.connect(
-            "leave", lambda controller: self.onMouseLeave(controller, button)
-        )
-        button.add_controller(motionController)
+            button.image.set_from_icon_name("image-missing")
+
+        # Use set_name for the widget ID, not set_id (deprecated/internal)
+        button.set_name(id)
 
-        self.buttons.append(button)
+        # The button is passed as user data, so no closure is created per button
+        button.motion_controller.connect("enter", self.onMouseEnter, button)
+        button.motion_controller.connect("leave", self.onMouseLeave, button)
         button.connect("clicked", self.onMouseClick)
-        button.set_tooltip_text(self.appConfig.buttons[self.currentFocusIndex].hint)
+        button.set_tooltip_text(hint)
 
         return button
 
@@ -412,16 +1041,22 @@ class Window:
         Handle window close event.
 
         Properly terminates the GTK application when the window is closed.
+        A pooled window is only hidden so it can be shown again.
 
         Args:
             window: The GTK window being closed
 
         Returns:
-            bool: False to allow the window to close
+            bool: False to allow the window to close, True to keep a pooled window
 
         Side Effects:
+            - Cancels running pre-hooks
             - Calls self.app.quit() to terminate the application
         """
+        self.cancelHooks()
+        if self.pooled:
+            window.set_visible(False)
+            return True
         self.app.quit()
         return False
 